@@ -1,3 +1,16 @@
-from launchd_me.plist import PlistCreator, ScheduleType
+__version__ = "0.0.1"
 
 __all__ = ["PlistCreator", "ScheduleType"]
+
+
+def __getattr__(name: str):
+    """Import the public plist API on first access.
+
+    Importing ``launchd_me.plist`` pulls in ``rich`` and the database layer. Deferring
+    it keeps ``import launchd_me.cli`` (and so ``ldm --help``) lightweight.
+    """
+    if name in __all__:
+        from launchd_me import plist
+
+        return getattr(plist, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,81 +1,92 @@
 import argparse
+import functools
+import os
 import shutil
+import stat
+import sys
 from pathlib import Path
+from typing import TYPE_CHECKING, List, Optional, Tuple
 
-from launchd_me.exceptions import UnexpectedInstallationStatus
-from launchd_me.logger_config import logger
-from launchd_me.plist import (
-    DbDisplayer,
-    LaunchdMeInit,
-    PlistCreator,
-    PlistDbGetters,
-    PlistDbSetters,
-    PlistFileIDNotFound,
-    PlistInstallationManager,
-    UserConfig,
+from launchd_me import __version__
+from launchd_me.exceptions import PlistFileIDNotFound, UnexpectedInstallationStatus
+
+if TYPE_CHECKING:
+    from launchd_me.plist import (
+        PlistDbGetters,
+        PlistInstallationManager,
+        UserConfig,
+    )
+
+SUBPARSER_TITLE = "subcommands"
+SUBPARSER_DESCRIPTION = ""
+CREATE_DESCRIPTION = "Create a plist file to schedule a given script."
+CREATE_HELP = "create a plist file to schedule a given script."
+CREATE_SCRIPT_PATH_HELP = "path to the script to schedule."
+CREATE_SCHEDULE_TYPE_HELP = (
+    "schedule_type. An 'interval' schedule requires seconds e.g. 300. A 'calendar' "
+    "schedules require a dictionary of fields e.g. {'Weekday': 1, 'Hour': 8}. "
+    "Allowed fields are: 'Minute', 'Hour', 'Day', 'Weekday', 'Month'. See the "
+    "documentation for more details."
+)
+CREATE_SCHEDULE_DETAILS_HELP = (
+    "schedule for running the script e.g. 300 or {'Weekday': 1, 'Hour': 8}."
 )
-from launchd_me.templates.logo import (
-    LOGO_ART_ROCKET,
-    LOGO_ART_ROCKET_THREE,
-    LOGO_ART_ROCKET_TWO,
+CREATE_DESCRIPTION_HELP = (
+    "description of what you're automating e.g. daily downloads tidy."
 )
+CREATE_MAKE_EXECUTABLE_HELP = "ensure the specified script is executable."
+CREATE_AUTO_INSTALL_HELP = "load the plist file to schedule the script automatically."
+LIST_DESCRIPTION = "List all tracked plist files or show a given plist_id."
+LIST_HELP = "list all tracked plist files or show a given plist_id"
+LIST_PLIST_ID_HELP = "display details of plist_id"
+INSTALL_DESCRIPTION = "Install a given plist file."
+INSTALL_HELP = "install a given plist file"
+INSTALL_PLIST_ID_HELP = "the plist file to install"
+UNINSTALL_DESCRIPTION = "Uninstall a given plist file."
+UNINSTALL_HELP = "uninstall a given plist file"
+UNINSTALL_PLIST_ID_HELP = "the plist file to un-install"
+RESET_DESCRIPTION = "Delete the current db and plist directory. Currently does not unload or delete existing plist symlinks."
+RESET_HELP = "delete the current db and plist directory. currently does not unload or delete existing plist symlinks"
+
+COMMANDS_REQUIRING_INIT = {"create", "list", "install", "uninstall"}
+# Mirrors `launchd_me.plist.ScheduleType`, which isn't imported to keep parsing light.
+SCHEDULE_TYPES = ("interval", "calendar")
+
+
+@functools.lru_cache(maxsize=1)
+def _get_logo() -> str:
+    """Return the logo shown at the top of the main help message.
+
+    Built on first use as it is only displayed when every subcommand is listed i.e.
+    top-level help, no command or an unknown command.
 
-USER_CONFIG = UserConfig()
-LOGO_ART = """
- ___       _______   __   __   __    _   _______   __   __   ______      __   __   _______   __
-|   |     |   _   | |  | |  | |  |  | | |       | |  | |  | |      |    |  |_|  | |       | |  |
-|   |     |  |_|  | |  | |  | |   |_| | |       | |  |_|  | |  _    |   |       | |    ___| |  |
-|   |     |       | |  |_|  | |       | |       | |       | | | |   |   |       | |   |___  |  |
-|   |___  |       | |       | |  _    | |      _| |       | | |_|   |   |       | |    ___| |__|
-|       | |   _   | |       | | | |   | |     |_  |   _   | |       |   | ||_|| | |   |___   __
-|_______| |__| |__| |_______| |_|  |__| |_______| |__| |__| |______|    |_|   |_| |_______| |__|
-"""
-LOGO_DIVIDER = "=" * 106
-LOGO_TEXT = "Easily schedule your scripts on macOS".center(107, " ")
-LOGO = f"{LOGO_ART_ROCKET}\n{LOGO_DIVIDER}\n{LOGO_TEXT}\n{LOGO_DIVIDER}\n\n"
-CLI_TEXT = {
-    "PARSER": {"DESCRIPTION": "Easily schedule your scripts on macOS."},
-    "SUBPARSER": {
-        "TITLE": "subcommands",
-        "DESCRIPTION": "",
-    },
-    "COMMANDS": {
-        "CREATE": {
-            "DESCRIPTION": "Create a plist file to schedule a given script.",
-            "HELP": "create a plist file to schedule a given script.",
-            "ARGS": {
-                "SCRIPT_PATH_HELP": "path to the script to schedule.",
-                "SCHEDULE_TYPE_HELP": """schedule_type. An 'interval' schedule requires seconds e.g. 300. A 'calendar'
-                                         schedules require a dictionary of fields e.g. {'Weekday': 1, 'Hour': 8}.
-                                         Allowed fields are: 'Minute', 'Hour', 'Day', 'Weekday', 'Month'. See the
-                                         documentation for more details.""",
-                "SCHEDULE_DETAILS_HELP": "schedule for running the script e.g. 300 or {'Weekday': 1, 'Hour': 8}.",
-                "DESCRIPTION_HELP": "description of what you're automating e.g. daily downloads tidy.",
-                "MAKE_EXECUTABLE_HELP": "ensure the specified script is executable. defaults to true.",
-                "AUTO_INSTALL_HELP": "load the plist file to schedule the script automatically. defaults to true",
-            },
-        },
-        "LIST": {
-            "DESCRIPTION": "List all tracked plist files or show a given plist_id.",
-            "HELP": "list all tracked plist files or show a given plist_id",
-            "ARGS": {"PLIST_ID_HELP": "display details of plist_id"},
-        },
-        "INSTALL": {
-            "DESCRIPTION": "Install a given plist file.",
-            "HELP": "install a given plist file",
-            "ARGS": {"PLIST_ID_HELP": "the plist file to install"},
-        },
-        "UNINSTALL": {
-            "DESCRIPTION": "Uninstall a given plist file.",
-            "HELP": "uninstall a given plist file",
-            "ARGS": {"PLIST_ID_HELP": "the plist file to un-install"},
-        },
-        "RESET": {
-            "DESCRIPTION": "Delete the current db and plist directory. Currently does not unload or delete existing plist symlinks.",
-            "HELP": "delete the current db and plist directory. currently does not unload or delete existing plist symlinks",
-        },
-    },
-}
+    Returns
+    -------
+    str
+        The logo art, divided from the tagline.
+    """
+    from launchd_me.templates.logo import LOGO_ART_ROCKET
+
+    logo_divider = "=" * 106
+    logo_text = "Easily schedule your scripts on macOS".center(107, " ")
+    return f"{LOGO_ART_ROCKET}\n{logo_divider}\n{logo_text}\n{logo_divider}\n\n"
+
+
+@functools.lru_cache(maxsize=1)
+def _user_config() -> "UserConfig":
+    """Return the user's configuration, creating it on first use.
+
+    ``launchd_me.plist`` is imported here, rather than at module level, so that help
+    and argument error paths don't pay for importing the full plist stack.
+
+    Returns
+    -------
+    UserConfig
+        The configuration shared by every command in this process.
+    """
+    from launchd_me.plist import UserConfig
+
+    return UserConfig()
 
 
 def valid_path(path_str: str) -> Path:
@@ -89,17 +100,23 @@ def valid_path(path_str: str) -> Path:
     Returns
     -------
     Path
-        The string as a Pathlib path.
+        The string as an absolute Pathlib path. A leading ``~`` is expanded and the
+        path is made absolute with ``os.path.abspath`` (string manipulation only)
+        rather than resolved, so symlinks are not followed.
 
     Raises
     ------
     argparse.ArgumentTypeError
         If the passed string is not a path to a file.
     """
-    path = Path(path_str).resolve()
-    if not path.is_file():
+    path = os.path.expanduser(path_str)
+    try:
+        path_stat = os.stat(path)
+    except OSError:
+        raise argparse.ArgumentTypeError(f"Invalid file path: '{path_str}'")
+    if not stat.S_ISREG(path_stat.st_mode):
         raise argparse.ArgumentTypeError(f"Invalid file path: '{path_str}'")
-    return path
+    return Path(os.path.abspath(path))
 
 
 class CLIArgumentParser:
@@ -115,34 +132,60 @@ class CLIArgumentParser:
     Methods
     -------
     create_parser: argparse.ArgumentParser
-        Creates and returns the main argument parser with all subcommands.
+        Creates and returns the main argument parser with the required subcommands.
     """
 
     def __init__(self) -> None:
         self.parser = argparse.ArgumentParser(
             prog="ldm",
-            description=LOGO,
             formatter_class=argparse.RawDescriptionHelpFormatter,
         )
-        self.parser.set_defaults(func=self._default_action)
+        self.parser.add_argument(
+            "-V", "--version", action="version", version=f"%(prog)s {__version__}"
+        )
         self.subparsers = self.parser.add_subparsers(
-            title=CLI_TEXT["SUBPARSER"]["TITLE"],
-            description=CLI_TEXT["SUBPARSER"]["DESCRIPTION"],
+            dest="command",
+            title=SUBPARSER_TITLE,
+            description=SUBPARSER_DESCRIPTION,
         )
 
-    def create_parser(self) -> argparse.ArgumentParser:
+    def create_parser(
+        self, argv: Optional[List[str]] = None
+    ) -> argparse.ArgumentParser:
         """Add subcommands to the main argument parser.
 
+        If the first argument names a subcommand, only that subcommand is added as no
+        other subcommand can be parsed or displayed. Otherwise (no arguments, top-level
+        help, or an unknown subcommand) every subcommand and the logo are added so help
+        and error messages list them all.
+
+        Parameters
+        ----------
+        argv : Optional[List[str]]
+            The command-line arguments, excluding the program name. Defaults to
+            ``sys.argv[1:]``.
+
         Returns
         -------
         argparse.ArgumentParser
-            The configured argument parser with all subcommands added.
+            The configured argument parser with the required subcommands added.
         """
-        self._add_create_command()
-        self._add_list_command()
-        self._add_install_command()
-        self._add_uninstall_command()
-        self._add_reset_command()
+        add_command_methods = {
+            "create": self._add_create_command,
+            "list": self._add_list_command,
+            "install": self._add_install_command,
+            "uninstall": self._add_uninstall_command,
+            "reset": self._add_reset_command,
+        }
+        if argv is None:
+            argv = sys.argv[1:]
+        command = argv[0] if argv else None
+        if command in add_command_methods:
+            add_command_methods[command]()
+        else:
+            self.parser.description = _get_logo()
+            for add_command_method in add_command_methods.values():
+                add_command_method()
         return self.parser
 
     def _default_action(self, args: argparse.Namespace) -> None:
@@ -163,8 +206,7 @@ class CLIArgumentParser:
         """Add the `'create'` subcommand to the argument parser.
 
         This method configures the `'create'` subcommand, which allows users to create a
-        plist file to schedule a given script. It sets the default function to be called
-        when this subcommand is used and defines the necessary arguments for the
+        plist file to schedule a given script. It defines the necessary arguments for the
         subcommand.
 
         The `'create'` subcommand includes the following arguments:
@@ -174,128 +216,118 @@ class CLIArgumentParser:
            a dictionary for calendar).
         - `description`: A description of what is being automated.
         - `make_executable`: A flag to ensure the specified script is executable (defaults
-           to True).
+           to True, disable with `--no-make-executable`).
         - `auto_install`: A flag to automatically load the plist file to schedule the
-           script (defaults to True).
+           script (defaults to True, disable with `--no-auto-install`).
         """
         parser_create = self.subparsers.add_parser(
             "create",
-            help=CLI_TEXT["COMMANDS"]["CREATE"]["HELP"],
-            description=CLI_TEXT["COMMANDS"]["CREATE"]["DESCRIPTION"],
+            help=CREATE_HELP,
+            description=CREATE_DESCRIPTION,
         )
-        parser_create.set_defaults(func=create_plist)
         parser_create.add_argument(
             "script_path",
             type=valid_path,
-            help=CLI_TEXT["COMMANDS"]["CREATE"]["ARGS"]["SCRIPT_PATH_HELP"],
+            help=CREATE_SCRIPT_PATH_HELP,
         )
         parser_create.add_argument(
             "schedule_type",
-            choices=["interval", "calendar"],
-            help=CLI_TEXT["COMMANDS"]["CREATE"]["ARGS"]["SCHEDULE_TYPE_HELP"],
+            choices=SCHEDULE_TYPES,
+            help=CREATE_SCHEDULE_TYPE_HELP,
         )
         parser_create.add_argument(
             "schedule_details",
             type=int,
-            help=CLI_TEXT["COMMANDS"]["CREATE"]["ARGS"]["SCHEDULE_DETAILS_HELP"],
+            help=CREATE_SCHEDULE_DETAILS_HELP,
         )
         parser_create.add_argument(
             "description",
             type=str,
-            help=CLI_TEXT["COMMANDS"]["CREATE"]["ARGS"]["DESCRIPTION_HELP"],
+            help=CREATE_DESCRIPTION_HELP,
         )
         parser_create.add_argument(
             "-m",
             "--make-executable",
+            action=argparse.BooleanOptionalAction,
             default=True,
-            type=bool,
-            help=CLI_TEXT["COMMANDS"]["CREATE"]["ARGS"]["MAKE_EXECUTABLE_HELP"],
+            help=CREATE_MAKE_EXECUTABLE_HELP,
         )
         parser_create.add_argument(
             "-a",
             "--auto-install",
+            action=argparse.BooleanOptionalAction,
             default=True,
-            type=bool,
-            help=CLI_TEXT["COMMANDS"]["CREATE"]["ARGS"]["AUTO_INSTALL_HELP"],
+            help=CREATE_AUTO_INSTALL_HELP,
         )
 
     def _add_list_command(self) -> None:
         """Add the `'list'` subcommand to the argument parser.
 
         This method configures the `'list'` subcommand, which allows users to list all
-        tracked plist files or show details of a specific plist file by its ID. It sets
-        the default function to be called when this subcommand is used and defines the
-        necessary arguments for the subcommand.
+        tracked plist files or show details of a specific plist file by its ID. It
+        defines the necessary arguments for the subcommand.
 
         The `'list'` subcommand includes the following argument:
         - `plist_id`: An optional ID of the plist file to display details for.
         """
         parser_list = self.subparsers.add_parser(
             "list",
-            description=CLI_TEXT["COMMANDS"]["LIST"]["DESCRIPTION"],
-            help=CLI_TEXT["COMMANDS"]["LIST"]["HELP"],
+            description=LIST_DESCRIPTION,
+            help=LIST_HELP,
         )
-        parser_list.set_defaults(func=list_plists)
         parser_list.add_argument(
             "plist_id",
             type=int,
             nargs="?",
-            help=CLI_TEXT["COMMANDS"]["LIST"]["ARGS"]["PLIST_ID_HELP"],
+            help=LIST_PLIST_ID_HELP,
         )
 
     def _add_install_command(self) -> None:
         """Add the `'install'` subcommand to the argument parser.
 
         This method configures the `'install'` subcommand, which allows users to install
-        a given plist file. It sets the default function to be called when this
-        subcommand is used and defines the necessary argument for the subcommand.
+        a given plist file. It defines the necessary argument for the subcommand.
 
         The `'install'` subcommand includes the following argument:
         - `plist_id`: The ID of the plist file to install.
         """
         parser_install = self.subparsers.add_parser(
             "install",
-            description=CLI_TEXT["COMMANDS"]["INSTALL"]["DESCRIPTION"],
-            help=CLI_TEXT["COMMANDS"]["INSTALL"]["HELP"],
-        )
-        parser_install.set_defaults(func=install_plist)
-        parser_install.add_argument(
-            "plist_id", help=CLI_TEXT["COMMANDS"]["INSTALL"]["ARGS"]["PLIST_ID_HELP"]
+            description=INSTALL_DESCRIPTION,
+            help=INSTALL_HELP,
         )
+        parser_install.add_argument("plist_id", help=INSTALL_PLIST_ID_HELP)
 
     def _add_uninstall_command(self) -> None:
         """Add the `'uninstall'` subcommand to the argument parser.
 
         This method configures the `'uninstall'` subcommand, which allows users to
-        uninstall a given plist file. It sets the default function to be called when
-        this subcommand is used and defines the necessary argument for the subcommand.
+        uninstall a given plist file. It defines the necessary argument for the
+        subcommand.
 
         The `'uninstall'` subcommand includes the following argument:
         - `plist_id`: The ID of the plist file to uninstall.
         """
         parser_uninstall = self.subparsers.add_parser(
             "uninstall",
-            description=CLI_TEXT["COMMANDS"]["UNINSTALL"]["DESCRIPTION"],
-            help=CLI_TEXT["COMMANDS"]["UNINSTALL"]["HELP"],
+            description=UNINSTALL_DESCRIPTION,
+            help=UNINSTALL_HELP,
             formatter_class=argparse.RawDescriptionHelpFormatter,
         )
-        parser_uninstall.set_defaults(func=uninstall_plist)
-        parser_uninstall.add_argument("plist_id", help="The plist to un-install")
+        parser_uninstall.add_argument("plist_id", help=UNINSTALL_PLIST_ID_HELP)
 
     def _add_reset_command(self) -> None:
         """Add the `'reset'` subcommand to the argument parser.
 
         This method configures the `'reset'` subcommand, which allows users to delete the
-        current database and plist directory. It sets the default function to be called
-        when this subcommand is used.
+        current database and plist directory. It takes no arguments.
         """
-        parser_reset = self.subparsers.add_parser(
+        self.subparsers.add_parser(
             "reset",
-            description=CLI_TEXT["COMMANDS"]["RESET"]["DESCRIPTION"],
-            help=CLI_TEXT["COMMANDS"]["RESET"]["HELP"],
+            description=RESET_DESCRIPTION,
+            help=RESET_HELP,
             formatter_class=argparse.RawDescriptionHelpFormatter,
         )
-        parser_reset.set_defaults(func=reset_user)
 
 
 def create_plist(args: argparse.Namespace) -> None:
@@ -318,6 +350,9 @@ def create_plist(args: argparse.Namespace) -> None:
         - `auto_install`: Flag to automatically load the plist file to schedule the
            script.
     """
+    from launchd_me.logger_config import logger
+    from launchd_me.plist import PlistCreator
+
     logger.debug("Instantiating PlistCreator.")
     plc = PlistCreator(
         args.script_path,
@@ -326,7 +361,7 @@ def create_plist(args: argparse.Namespace) -> None:
         args.description,
         args.make_executable,
         args.auto_install,
-        USER_CONFIG,
+        _user_config(),
     )
     logger.debug("Calling PlistCreator.driver()")
     plc.driver()
@@ -346,25 +381,58 @@ def list_plists(args: argparse.Namespace) -> None:
         The arguments passed to the 'list' subcommand. Expected attributes are:
         - `plist_id`: An optional ID of the plist file to display details for.
     """
-    db_getters = PlistDbGetters(USER_CONFIG)
+    from launchd_me.logger_config import logger
+    from launchd_me.plist import DbDisplayer, PlistDbGetters
+
+    user_config = _user_config()
+    db_getters = PlistDbGetters(user_config)
     if args.plist_id:
         logger.debug("Displaying a single plist file detail.")
-        db_displayer = DbDisplayer(USER_CONFIG)
+        db_displayer = DbDisplayer(user_config)
         row = db_getters.get_a_single_plist_file_details(args.plist_id)
         db_displayer.display_single_plist_file_detail_table(row)
     else:
         logger.debug("Displaying all plist files.")
         all_rows = db_getters.get_all_tracked_plist_files()
-        db_all_rows_displayer = DbDisplayer(USER_CONFIG)
+        db_all_rows_displayer = DbDisplayer(user_config)
         db_all_rows_displayer.display_all_tracked_plist_files_table(all_rows)
 
 
+def _installation_components(
+    user_config: "UserConfig",
+) -> Tuple["PlistDbGetters", "PlistInstallationManager"]:
+    """Create the db getter and installation manager used by install and uninstall.
+
+    Not cached: the objects only hold references to the user configuration, so are
+    cheap to build, and a cache would outlive the configuration they were built with.
+
+    Parameters
+    ----------
+    user_config : UserConfig
+        The user's configuration.
+
+    Returns
+    -------
+    Tuple[PlistDbGetters, PlistInstallationManager]
+        A db getter and an installation manager backed by a db setter.
+    """
+    from launchd_me.plist import (
+        PlistDbGetters,
+        PlistDbSetters,
+        PlistInstallationManager,
+    )
+
+    db_setter = PlistDbSetters(user_config)
+    install_manager = PlistInstallationManager(user_config, db_setter)
+    return PlistDbGetters(user_config), install_manager
+
+
 def install_plist(args: argparse.Namespace) -> None:
     """Install a given plist file.
 
-    This function is called when the `'install'` subcommand is used. It verifies the
-    provided plist ID, verifies the plist ID is currently not installed, then retrieves
-    the plist file details, and installs the plist file using the
+    This function is called when the `'install'` subcommand is used. It retrieves the
+    plist file details (which verifies the provided plist ID), verifies the plist ID is
+    currently not installed, and installs the plist file using the
     PlistInstallationManager.
 
     Parameters
@@ -378,23 +446,21 @@ def install_plist(args: argparse.Namespace) -> None:
     UnexpectedInstallationStatus
         If the installation status of the plist file is already installed.
     """
-    db_getter = PlistDbGetters(USER_CONFIG)
-    db_setter = PlistDbSetters(USER_CONFIG)
-    install_manager = PlistInstallationManager(USER_CONFIG, db_setter)
-    db_getter.verify_a_plist_id_is_valid(args.plist_id)
-    db_getter.verify_a_plist_id_installation_status(args.plist_id, "inactive")
+    user_config = _user_config()
+    db_getter, install_manager = _installation_components(user_config)
     plist_detail = db_getter.get_a_single_plist_file_details(args.plist_id)
-    plist_filename = Path(plist_detail["PlistFileName"])
-    plist_file_path = Path(USER_CONFIG.plist_dir) / plist_filename
+    db_getter.verify_a_plist_id_installation_status(args.plist_id, "inactive")
+    plist_file_path = user_config.plist_dir / plist_detail["PlistFileName"]
     install_manager.install_plist(args.plist_id, plist_file_path)
 
 
 def uninstall_plist(args: argparse.Namespace) -> None:
     """Uninstall a given plist file.
 
-    This function is called when the `'uninstall'` subcommand is used. It verifies the
-    provided plist ID, retrieves the plist file details, and uninstalls the plist file
-    using the PlistInstallationManager.
+    This function is called when the `'uninstall'` subcommand is used. It retrieves the
+    plist file details (which verifies the provided plist ID), verifies the plist ID is
+    currently installed, and uninstalls the plist file using the
+    PlistInstallationManager.
 
     Parameters
     ----------
@@ -402,14 +468,11 @@ def uninstall_plist(args: argparse.Namespace) -> None:
         The arguments passed to the `'uninstall'` subcommand. Expected attributes are:
         - `plist_id`: The ID of the plist file to uninstall.
     """
-    db_getter = PlistDbGetters(USER_CONFIG)
-    db_setter = PlistDbSetters(USER_CONFIG)
-    install_manager = PlistInstallationManager(USER_CONFIG, db_setter)
-    db_getter.verify_a_plist_id_is_valid(args.plist_id)
-    db_getter.verify_a_plist_id_installation_status(args.plist_id, "running")
+    user_config = _user_config()
+    db_getter, install_manager = _installation_components(user_config)
     plist_detail = db_getter.get_a_single_plist_file_details(args.plist_id)
-    plist_file_name = Path(plist_detail["PlistFileName"])
-    symlink_to_plist = Path(USER_CONFIG.launch_agents_dir) / plist_file_name
+    db_getter.verify_a_plist_id_installation_status(args.plist_id, "running")
+    symlink_to_plist = user_config.launch_agents_dir / plist_detail["PlistFileName"]
     install_manager.uninstall_plist(args.plist_id, symlink_to_plist)
 
 
@@ -418,7 +481,8 @@ def reset_user(args: argparse.Namespace) -> None:
 
     This function is called when the `'reset'` subcommand is used. It fetches the
     project directory from the user configuration and deletes it along with all its
-    contents.
+    contents. If the project directory doesn't exist there is nothing to reset and
+    a message is printed instead.
 
     Parameters
     ----------
@@ -426,32 +490,97 @@ def reset_user(args: argparse.Namespace) -> None:
         The arguments passed to the `'reset'` subcommand. This function does not expect
         any specific attributes in the args.
     """
+    from launchd_me.logger_config import logger
+
     logger.debug("Fetching the project directory")
-    project_dir = USER_CONFIG.project_dir
-    logger.debug(f"Project directory: {project_dir}")
-    logger.debug(f"Deleting: {project_dir}")
+    project_dir = _user_config().project_dir
+    logger.debug("Project directory: %s", project_dir)
+    if not project_dir.exists():
+        print(f"Nothing to reset: {project_dir} does not exist.")
+        return
+    logger.debug("Deleting: %s", project_dir)
     shutil.rmtree(project_dir)
     logger.debug("Project directory and contents deleted")
 
 
+COMMAND_HANDLERS = {
+    "create": create_plist,
+    "list": list_plists,
+    "install": install_plist,
+    "uninstall": uninstall_plist,
+    "reset": reset_user,
+}
+
+
+def parse_simple_command(argv: List[str]) -> Optional[argparse.Namespace]:
+    """Parse the arguments of a flag-free subcommand without building the parser.
+
+    ``'list'``, ``'install'``, ``'uninstall'`` and ``'reset'`` take at most one
+    positional argument, so well-formed invocations can be turned into a Namespace
+    directly. Anything else (``'create'``, help, flags, unexpected or malformed
+    arguments) returns None and is left to the full argparse parser, which remains the
+    authoritative definition of the CLI and produces all help and error messages.
+
+    Parameters
+    ----------
+    argv : List[str]
+        The command-line arguments, excluding the program name.
+
+    Returns
+    -------
+    Optional[argparse.Namespace]
+        A Namespace matching what the argparse parser would produce, or None if the
+        arguments need the full parser.
+    """
+    if not argv:
+        return None
+    command, command_args = argv[0], argv[1:]
+    if command == "reset" and not command_args:
+        return argparse.Namespace(command=command)
+    if command == "list":
+        if not command_args:
+            return argparse.Namespace(command=command, plist_id=None)
+        if len(command_args) == 1 and command_args[0].isdecimal():
+            return argparse.Namespace(command=command, plist_id=int(command_args[0]))
+    if command in ("install", "uninstall") and len(command_args) == 1:
+        if not command_args[0].startswith("-"):
+            return argparse.Namespace(command=command, plist_id=command_args[0])
+    return None
+
+
 def main() -> None:
     """The main entry point for the launchd_me CLI tool.
 
-    This function initializes the user configuration and the launchd_me environment,
-    creates the argument parser with all subcommands, parses the command-line arguments,
-    and executes the appropriate function based on the provided subcommand.
+    This function parses the command-line arguments (building the argument parser only
+    when `parse_simple_command` can't handle them), initializes the launchd_me
+    environment if the subcommand needs it, and executes the subcommand's handler from
+    `COMMAND_HANDLERS`. With no subcommand, the main help is printed instead.
+
+    `--version` is answered before any parsing. Help, argument errors, `'reset'` and
+    the no-command path never touch the application directories or database, so they
+    skip initialisation entirely.
 
     If an invalid plist ID is provided, it catches the PlistFileIDNotFound exception
     and prints the error message.
     """
-    user_config = UserConfig()
-    ldm = LaunchdMeInit(user_config)
-    ldm.initialise_launchd_me()
-    parser_creator = CLIArgumentParser()
-    parser = parser_creator.create_parser()
-    args = parser.parse_args()
+    if sys.argv[1:] in (["-V"], ["--version"]):
+        print(f"ldm {__version__}")
+        return
+    args = parse_simple_command(sys.argv[1:])
+    if args is None:
+        parser_creator = CLIArgumentParser()
+        parser = parser_creator.create_parser()
+        args = parser.parse_args()
+        if args.command is None:
+            parser_creator._default_action(args)
+            return
+    if args.command in COMMANDS_REQUIRING_INIT:
+        from launchd_me.plist import LaunchdMeInit
+
+        ldm = LaunchdMeInit(_user_config())
+        ldm.initialise_launchd_me()
     try:
-        args.func(args)
+        COMMAND_HANDLERS[args.command](args)
     except PlistFileIDNotFound as error:
         print(error)
     except UnexpectedInstallationStatus as error:
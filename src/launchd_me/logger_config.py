@@ -1,17 +1,25 @@
+import functools
 import logging
 import os
 import platform
+from logging.handlers import MemoryHandler
 from pathlib import Path
 
+_LOG_DIR_BUILDERS = {
+    "Windows": lambda home, app_name: (
+        Path(os.getenv("APPDATA", home)) / app_name / "logs"
+    ),
+    "Darwin": lambda home, app_name: home / "Library" / "Logs" / app_name,
+}
+_build_log_dir = _LOG_DIR_BUILDERS.get(
+    platform.system(),
+    lambda home, app_name: home / ".local" / "share" / app_name / "logs",  # Linux
+)
 
+
+@functools.lru_cache(maxsize=None)
 def get_log_path(app_name: str = "launchd-me") -> Path:
-    home = Path.home()
-    if platform.system() == "Windows":
-        log_path = Path(os.getenv("APPDATA", home)) / app_name / "logs"
-    elif platform.system() == "Darwin":
-        log_path = home / "Library" / "Logs" / app_name
-    else:  # Linux
-        log_path = home / ".local" / "share" / app_name / "logs"
+    log_path = _build_log_dir(Path.home(), app_name)
     log_path.mkdir(parents=True, exist_ok=True)
     return log_path
 
@@ -28,7 +36,16 @@ def setup_logger(log_path: Path, app_name: str = "launchd-me"):
     file_handler = logging.FileHandler(log_file_path)
     file_handler.setLevel(logging.DEBUG)
     file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
+    # Buffer records and write them in batches. Errors flush immediately and
+    # `logging.shutdown` (run at exit) flushes anything left.
+    buffered_file_handler = MemoryHandler(
+        capacity=1024,
+        flushLevel=logging.ERROR,
+        target=file_handler,
+        flushOnClose=True,
+    )
+    buffered_file_handler.setLevel(logging.DEBUG)
+    logger.addHandler(buffered_file_handler)
 
     console_handler = logging.StreamHandler()
     console_handler.setLevel(logging.INFO)
@@ -37,6 +54,19 @@ def setup_logger(log_path: Path, app_name: str = "launchd-me"):
     return logger
 
 
-log_path = get_log_path()
-logger = setup_logger(log_path)
-logger.debug(f"Log directory and logger have been configured for {logger.name}")
+def __getattr__(name: str):
+    """Configure the logger on first access of ``logger`` or ``log_path``.
+
+    Importing this module doesn't create the log directory or open the log file.
+    The configured values are stored as module globals so later lookups bypass this
+    function (PEP 562).
+    """
+    if name in ("logger", "log_path"):
+        log_path = get_log_path()
+        logger = setup_logger(log_path)
+        globals().update(log_path=log_path, logger=logger)
+        logger.debug(
+            "Log directory and logger have been configured for %s", logger.name
+        )
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,14 +1,18 @@
+import atexit
+import contextlib
+import functools
 import getpass
-import logging
+import os
 import re
 import sqlite3
+import stat
 import subprocess
 import types
 from datetime import datetime
 from enum import Enum
 from importlib import resources
 from pathlib import Path
-from typing import Dict, Union
+from typing import Dict, Iterable, Iterator, List, Tuple, Union
 
 import rich
 from rich.console import Console
@@ -21,17 +25,74 @@ from launchd_me.exceptions import (
 )
 from launchd_me.logger_config import logger
 from launchd_me.sql_statements import (
-    CREATE_TABLE_INSTALLATION_EVENTS,
-    CREATE_TABLE_PLISTFILES,
-    PLISTFILES_COUNT_ALL_ROWS,
+    CREATE_SCHEMA,
     PLISTFILES_GET_INSTALL_STATUS,
     PLISTFILES_INSERT_RECORD_INTO,
+    PLISTFILES_PLIST_ID_EXISTS,
     PLISTFILES_SELECT_ALL_FIELDS_FOR_LIST_COMMAND,
+    PLISTFILES_SELECT_MAX_PLIST_FILE_ID,
     PLISTFILES_SELECT_SINGLE_PLIST_FILE,
-    PLISTFILES_SET_CURRENT_STATE_INACTIVE,
-    PLISTFILES_SET_CURRENT_STATE_RUNNING,
+    PLISTFILES_SET_CURRENT_STATE,
+    SCHEMA_VERSION,
+    SELECT_LAST_INSERT_ROWID,
 )
 
+# Inclusive (lowest, highest) values for each launchd StartCalendarInterval key.
+VALID_CALENDAR_DURATIONS = {
+    "Month": (1, 12),
+    "Day": (1, 31),
+    "Hour": (0, 23),
+    "Minute": (0, 59),
+    "Weekday": (0, 6),  # 0 is Sunday
+}
+PLIST_TEMPLATE_PLACEHOLDER = re.compile(r"\{\{([\w.]+)\}\}")
+XML_TAG = re.compile(r"<[^>]+>")
+PLIST_TEMPLATE_PATH = resources.files("launchd_me.templates").joinpath(
+    "plist_template.txt"
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _load_plist_template(template_path: Path) -> str:
+    """Read a plist template, caching its content for the rest of the process.
+
+    ``read_text`` is used rather than ``open`` so package resources that are not
+    plain files, e.g. inside a zipped install, can be read too.
+
+    Parameters
+    ----------
+    template_path: Path
+        Path to the plist template, normally ``UserConfig.plist_template_path``.
+
+    Returns
+    -------
+    str
+        The template content with its ``{{PLACEHOLDERS}}`` intact.
+    """
+    return template_path.read_text(encoding="utf-8")
+
+
+@functools.lru_cache(maxsize=1024)
+def _format_iso_date(iso_datetime: str) -> str:
+    """Reformat an ISO datetime string as YYYY-MM-DD, caching repeated dates.
+
+    See ``DbDisplayer._format_date``.
+    """
+    # Extended ISO strings, as written by ``PlistDbSetters``, already start with the
+    # date, so only other forms need parsing.
+    if iso_datetime[4:5] == "-" and iso_datetime[7:8] == "-":
+        return iso_datetime[:10]
+    if iso_datetime.endswith("Z"):
+        iso_datetime = iso_datetime.replace("Z", "+00:00")
+    parsed = datetime.fromisoformat(iso_datetime)
+    return f"{parsed.year:04d}-{parsed.month:02d}-{parsed.day:02d}"
+
+
+@functools.lru_cache(maxsize=1)
+def _get_user_name() -> str:
+    """Return the current user's login name, looked up once per process."""
+    return getpass.getuser()
+
 
 class ScheduleType(str, Enum):
     """Enum for specifying plist schedule type."""
@@ -71,15 +132,13 @@ class UserConfig:
     """
 
     def __init__(self, user_dir: Path = None) -> None:
-        self.user_name: str = getpass.getuser()
+        self.user_name: str = _get_user_name()
         self.user_dir = Path(user_dir) if user_dir else Path.home()
-        self.project_dir = Path(self.user_dir / "launchd-me")
-        self.plist_dir = Path(self.project_dir / "plist_files")
-        self.ldm_db_file = Path(self.user_dir / "launchd-me" / "launchd-me.db")
-        self.plist_template_path = resources.files("launchd_me.templates").joinpath(
-            "plist_template.txt"
-        )
-        self.launch_agents_dir = Path(self.user_dir / "Library" / "LaunchAgents")
+        self.project_dir = self.user_dir / "launchd-me"
+        self.plist_dir = self.project_dir / "plist_files"
+        self.ldm_db_file = self.project_dir / "launchd-me.db"
+        self.plist_template_path = PLIST_TEMPLATE_PATH
+        self.launch_agents_dir = self.user_dir / "Library" / "LaunchAgents"
 
 
 class PListDbConnectionManager:
@@ -88,6 +147,14 @@ class PListDbConnectionManager:
     Creates the db if it doesn't already exist. Requires the launchd-me dir to exist
     assuming launchd-me init has already run.
 
+    One connection per database file is opened on first use and shared by every
+    manager for the rest of the process. Each ``with`` block gets its own cursor and
+    ends in a commit or rollback. Shared connections are closed at exit.
+
+    Blocks can be nested, e.g. to group several writes into one transaction. Only the
+    outermost block commits or rolls back; an exception from an inner block rolls
+    back all the work in the outer block if it propagates.
+
     Raises
     ------
     FileNotFoundError:
@@ -95,48 +162,119 @@ class PListDbConnectionManager:
         launchd-me init must run first.
     """
 
+    _connections: Dict[Path, sqlite3.Connection] = {}
+    _transaction_depths: Dict[Path, int] = {}
+
     def __init__(self, user_config: UserConfig) -> None:
         self.db_file = user_config.ldm_db_file
-        if not user_config.project_dir.exists():
-            try:
+        # An existing db implies the launchd-me directory exists, so the directory is
+        # only checked when the db needs creating.
+        if not self.db_file.exists():
+            if not user_config.project_dir.exists():
+                logger.error("Application directory is missing.")
                 raise FileNotFoundError(
                     "Launchd-me directory not created. Ensure "
                     "LaunchdMeInit.initialise_launchd_me() is run first."
                 )
-            except FileNotFoundError:
-                logging.exception("Application directory is missing.")
-                raise
-        if not self.db_file.exists():
             self._create_db()
         self.connection = None
         self.cursor = None
 
     def __enter__(self) -> sqlite3.Cursor:
-        """Establish the connection and return the cursor."""
-        self.connection = sqlite3.connect(self.db_file)
+        """Get the shared connection and return a new cursor."""
+        self.connection = self._get_connection(self.db_file)
+        depth = self._transaction_depths.get(self.db_file, 0)
+        self._transaction_depths[self.db_file] = depth + 1
         self.cursor = self.connection.cursor()
         return self.cursor
 
     def __exit__(
         self, exc_type: type, exc_val: Exception, exc_tb: types.TracebackType
     ) -> None:
-        """Commit if no exception, otherwise rollback. Close the connection."""
-        if exc_type is None:
+        """Commit if no exception, otherwise rollback. Close the cursor.
+
+        Nested blocks leave the commit or rollback to the outermost block. The
+        connection stays open for reuse; see ``close_all``.
+        """
+        self.cursor.close()
+        depth = self._transaction_depths.pop(self.db_file) - 1
+        if depth:
+            self._transaction_depths[self.db_file] = depth
+        elif exc_type is None:
             self.connection.commit()
         else:
             self.connection.rollback()
-        self.cursor.close()
-        self.connection.close()
+
+    @classmethod
+    def _get_connection(cls, db_file: Path) -> sqlite3.Connection:
+        """Return the shared connection to ``db_file``, opening it if required.
+
+        New connections use write-ahead logging with ``synchronous=NORMAL`` so commits
+        don't wait on an fsync of the db file. They also bring the schema up to
+        ``SCHEMA_VERSION``; see ``_upgrade_schema``.
+        """
+        connection = cls._connections.get(db_file)
+        if connection is None:
+            connection = sqlite3.connect(db_file)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            cls._upgrade_schema(connection)
+            cls._connections[db_file] = connection
+        return connection
+
+    @staticmethod
+    def _upgrade_schema(connection: sqlite3.Connection) -> None:
+        """Create or upgrade the schema if the db is older than ``SCHEMA_VERSION``.
+
+        The db's ``PRAGMA user_version`` records the schema version it was last brought
+        up to; new and pre-versioning dbs read 0. Every statement in ``CREATE_SCHEMA`` is
+        ``IF NOT EXISTS``, so running it on an older db only adds what is missing (e.g.
+        indexes) before stamping the current version. Up-to-date dbs skip it.
+        """
+        (user_version,) = connection.execute("PRAGMA user_version").fetchone()
+        if user_version < SCHEMA_VERSION:
+            logger.debug(
+                "Upgrading database schema from version %s to %s.",
+                user_version,
+                SCHEMA_VERSION,
+            )
+            connection.executescript(CREATE_SCHEMA)
+
+    @classmethod
+    def _close_connection(cls, db_file: Path) -> None:
+        """Close and forget the shared connection to ``db_file``, if there is one."""
+        connection = cls._connections.pop(db_file, None)
+        if connection is not None:
+            connection.close()
+
+    @classmethod
+    def close_all(cls) -> None:
+        """Close every shared connection. Registered to run at interpreter exit."""
+        for db_file in list(cls._connections):
+            cls._close_connection(db_file)
+
+    @classmethod
+    def create_schema(cls, db_file: Path) -> None:
+        """Create the database file and tables at ``db_file``.
+
+        Opening the shared connection creates the schema, in one script and one
+        transaction, via ``_upgrade_schema``. This is safe to call on an existing
+        database. The connection is kept open as the shared connection for
+        ``db_file``.
+        """
+        logger.debug("Creating database.")
+        # A shared connection to a deleted db would keep using the unlinked file.
+        if not db_file.exists():
+            cls._close_connection(db_file)
+        cls._get_connection(db_file)
+        logger.debug("Database created.")
 
     def _create_db(self):
         """Create the database files and tables. Only runs if not previously run."""
-        with sqlite3.connect(self.db_file) as connection:
-            logger.debug("Creating database.")
-            cursor = connection.cursor()
-            cursor.execute(CREATE_TABLE_PLISTFILES)
-            cursor.execute(CREATE_TABLE_INSTALLATION_EVENTS)
-            connection.commit()
-            logger.debug("Database created.")
+        self.create_schema(self.db_file)
+
+
+atexit.register(PListDbConnectionManager.close_all)
 
 
 class LaunchdMeInit:
@@ -146,7 +284,17 @@ class LaunchdMeInit:
         self._user_config = user_config
 
     def initialise_launchd_me(self) -> None:
-        """Runs all initialisation methods."""
+        """Runs all initialisation methods.
+
+        Returns early if the plist directory and database already exist, which is the
+        case for every run after the first.
+        """
+        if (
+            self._user_config.plist_dir.exists()
+            and self._user_config.ldm_db_file.exists()
+        ):
+            logger.debug("Launchd-me already initialised.")
+            return
         logger.debug("Initialising launchd-me")
         logger.debug("Ensure application directory exists.")
         self._create_app_directories()
@@ -154,15 +302,21 @@ class LaunchdMeInit:
         self._ensure_db_exists()
 
     def _create_app_directories(self) -> None:
-        """Create the required app directories if they don't already exist."""
-        self._user_config.project_dir.mkdir(parents=True, exist_ok=True)
+        """Create the required app directories if they don't already exist.
+
+        ``plist_dir`` is inside ``project_dir``, so one ``mkdir`` creates both.
+        """
         self._user_config.plist_dir.mkdir(parents=True, exist_ok=True)
         logger.debug("App directories exist.")
 
     def _ensure_db_exists(self) -> None:
-        """Create of the ldm database file if it doesn't already exist."""
+        """Create of the ldm database file if it doesn't already exist.
+
+        Creates the schema directly rather than via a ``PListDbConnectionManager``,
+        whose constructor would repeat the existence checks already made here.
+        """
         if not self._user_config.ldm_db_file.exists():
-            PListDbConnectionManager(self._user_config)
+            PListDbConnectionManager.create_schema(self._user_config.ldm_db_file)
 
 
 class LaunchdMeUninstaller:
@@ -277,19 +431,22 @@ class PlistCreator:
         """
         if self.schedule_type == "calendar":
             self._validate_calendar_schedule(self.schedule)
-        plist_filename = self._generate_file_name()
-        schedule_block = self._create_schedule_block()
-        plist_content = self._create_plist_content(plist_filename, schedule_block)
-        plist_file_path = Path(self.user_config.plist_dir / plist_filename)
-        self._write_file(plist_file_path, plist_content)
-        plist_id = self.db_setter.add_newly_created_plist_file(
-            plist_filename,
-            self.path_to_script_to_automate.name,
-            self.schedule_type,
-            self.schedule,
-            self.description,
-            plist_content,
-        )
+        # Name the file and record it in one transaction so the ID in the name can't
+        # be taken by another process in between.
+        with self.db_setter.batch():
+            plist_filename = self._generate_file_name()
+            schedule_block = self._create_schedule_block()
+            plist_content = self._create_plist_content(plist_filename, schedule_block)
+            plist_file_path = Path(self.user_config.plist_dir / plist_filename)
+            self._write_file(plist_file_path, plist_content)
+            plist_id = self.db_setter.add_newly_created_plist_file(
+                plist_filename,
+                self.path_to_script_to_automate.name,
+                self.schedule_type,
+                self.schedule,
+                self.description,
+                plist_content,
+            )
         if self.make_executable:
             self._make_script_executable()
         if self.auto_install:
@@ -316,10 +473,12 @@ class PlistCreator:
         """
 
         with PListDbConnectionManager(self.user_config) as cursor:
-            cursor.execute(PLISTFILES_COUNT_ALL_ROWS)
-            row_count = cursor.fetchone()[0]
-        plist_id = row_count + 1
-        plist_file_name = f"local.{self.user_config.user_name}.{self.path_to_script_to_automate.name.split('.')[0]}_{plist_id:04}.plist"
+            cursor.execute(PLISTFILES_SELECT_MAX_PLIST_FILE_ID)
+            plist_id = cursor.fetchone()[0] + 1
+        script_stem = self.path_to_script_to_automate.stem
+        plist_file_name = (
+            f"local.{self.user_config.user_name}.{script_stem}_{plist_id:04}.plist"
+        )
         logger.debug("Generated plist file name.")
         return plist_file_name
 
@@ -329,19 +488,26 @@ class PlistCreator:
         """
         with open(str(plist_path), "w") as file_handle:
             file_handle.write(plist_content)
-        logger.info(f"Plist file created at {plist_path}")
+        logger.info("Plist file created at %s", plist_path)
 
     def _make_script_executable(self) -> None:
         """
         Makes the script to be automated executable by changing its permissions.
 
+        Equivalent to ``chmod +x``: execute permission is added for user, group and
+        others, leaving any other mode bits unchanged.
+
         Raises
         ------
-        CalledProcessError
-            If the subprocess call returns a non-zero (error) status.
+        OSError
+            If the script's permissions cannot be read or changed.
         """
-        logger.info(f"Ensure {self.path_to_script_to_automate} is executable.")
-        subprocess.run(["chmod", "+x", self.path_to_script_to_automate], check=True)
+        logger.info("Ensure %s is executable.", self.path_to_script_to_automate)
+        mode = os.stat(self.path_to_script_to_automate).st_mode
+        os.chmod(
+            self.path_to_script_to_automate,
+            mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH,
+        )
 
     def _validate_calendar_schedule(self, calendar_schedule: dict) -> None:
         """
@@ -349,19 +515,24 @@ class PlistCreator:
 
         For more info see: https://www.launchd.info. Select "Configuration" -
         "Starting a job at a specific time/date: StartCalendarInterval"
+
+        Raises
+        ------
+        InvalidScheduleType
+            If a period is not a launchd calendar key, or its duration is not an
+            integer within that period's range.
         """
-        VALID_DURATIONS = {
-            "Month": range(1, 13),
-            "Day": range(1, 32),  # 1-31
-            "Hour": range(0, 24),  # 0-23
-            "Minute": range(0, 60),  # 0-59
-            "Weekday": range(0, 7),  # 0-6 (0 is Sunday)
-        }
         for period, duration in calendar_schedule.items():
-            if period not in VALID_DURATIONS.keys():
-                raise Exception(f"{period} is not a valid launchctl period.")
-            if duration not in VALID_DURATIONS[period]:
-                raise Exception(f"A duration of {duration} is not valid for {period}.")
+            try:
+                lowest, highest = VALID_CALENDAR_DURATIONS[period]
+            except KeyError:
+                raise InvalidScheduleType(
+                    f"{period} is not a valid launchctl period."
+                ) from None
+            if not isinstance(duration, int) or not lowest <= duration <= highest:
+                raise InvalidScheduleType(
+                    f"A duration of {duration} is not valid for {period}."
+                )
 
     def _create_schedule_block(self) -> str:
         """
@@ -404,11 +575,10 @@ class PlistCreator:
         str
             The XML string for the scheduling block of the plist file.
         """
-        block_middle = ""
-        for period, duration in self.schedule.items():
-            block_middle += (
-                f"\n\t\t<key>{period}</key>\n\t\t<integer>{duration}</integer>"
-            )
+        block_middle = "".join(
+            f"\n\t\t<key>{period}</key>\n\t\t<integer>{duration}</integer>"
+            for period, duration in self.schedule.items()
+        )
         calendar_block = (
             "<key>StartCalendarInterval</key>\n\t<dict>" + block_middle + "\n\t</dict>"
         )
@@ -417,7 +587,8 @@ class PlistCreator:
     def _create_plist_content(self, plist_filename, schedule_block) -> str:
         """Create plist body content.
 
-        Replaces the plist template  `{{PLACEHOLDERS}}` with required details.
+        Replaces the plist template  `{{PLACEHOLDERS}}` with required details in a
+        single pass. Placeholders without a replacement are left unchanged.
 
         Returns
         -------
@@ -425,20 +596,19 @@ class PlistCreator:
             The full content of the plist file based on the parameters passed with the
             `PlistCreator` was instantiated.
         """
-        with open(self.user_config.plist_template_path, "r") as file:
-            content = file.read()
-        content = content.replace("{{SCHEDULE_BLOCK}}", schedule_block)
-        content = content.replace("{{NAME_OF_PLIST_FILE}}", plist_filename)
-        content = content.replace(
-            "{{name_of_script.py}}", self.path_to_script_to_automate.name
-        )
-        content = content.replace(
-            "{{ABSOLUTE_PATH_TO_WORKING_DIRECTORY}}",
-            str(self.path_to_script_to_automate.parent),
-        )
-        # For log files.
-        content = content.replace(
-            "{{ABSOLUTE_PATH_TO_PROJECT_DIRECTORY}}", str(self.user_config.project_dir)
+        template = _load_plist_template(self.user_config.plist_template_path)
+        replacements = {
+            "SCHEDULE_BLOCK": schedule_block,
+            "NAME_OF_PLIST_FILE": plist_filename,
+            "name_of_script.py": self.path_to_script_to_automate.name,
+            "ABSOLUTE_PATH_TO_WORKING_DIRECTORY": str(
+                self.path_to_script_to_automate.parent
+            ),
+            # For log files.
+            "ABSOLUTE_PATH_TO_PROJECT_DIRECTORY": str(self.user_config.project_dir),
+        }
+        content = PLIST_TEMPLATE_PLACEHOLDER.sub(
+            lambda match: replacements.get(match.group(1), match.group(0)), template
         )
         logger.debug("Generated plist file content.")
         return content
@@ -457,7 +627,7 @@ class PlistDbSetters:
         description,
         plist_file_contents,
     ):
-        now = datetime.now().isoformat()
+        now = datetime.now().isoformat(timespec="seconds")
         logger.debug("Adding new plist file to database.")
         with PListDbConnectionManager(self.user_config) as cursor:
             cursor.execute(
@@ -475,20 +645,104 @@ class PlistDbSetters:
             )
         return cursor.lastrowid
 
-    def add_running_installation_status(self, file_id):
+    @contextlib.contextmanager
+    def batch(self) -> Iterator["PlistDbSetters"]:
+        """Group the db calls made inside the block into a single transaction.
+
+        Yields
+        ------
+        PlistDbSetters
+            This setter; every write made with it commits when the block exits.
+        """
         with PListDbConnectionManager(self.user_config) as cursor:
-            cursor.execute(
-                PLISTFILES_SET_CURRENT_STATE_RUNNING,
-                (file_id,),
+            if not cursor.connection.in_transaction:
+                # Take the write lock up front so reads in the block stay consistent
+                # with its writes.
+                cursor.execute("BEGIN IMMEDIATE")
+            yield self
+
+    def add_many_newly_created_plist_files(
+        self, plist_files: Iterable[Tuple[str, str, str, Union[int, str], str, str]]
+    ) -> List[int]:
+        """Add several newly created plist files in a single transaction.
+
+        Parameters
+        ----------
+        plist_files: Iterable[Tuple[str, str, str, Union[int, str], str, str]]
+            One tuple per plist file, with values in the same order as the arguments
+            of ``add_newly_created_plist_file``. The schedule value is an ``int`` for
+            interval schedules, e.g. 300 seconds.
+
+        Returns
+        -------
+        List[int]
+            The new PlistFileIDs, in the same order as ``plist_files``.
+
+        Notes
+        -----
+        ``INSERT ... RETURNING`` needs SQLite 3.35, newer than some supported Python
+        builds ship with. Instead, the IDs are derived from ``last_insert_rowid()``
+        and the number of rows inserted. They are consecutive: the insert holds the
+        write lock until the transaction ends, and ``AUTOINCREMENT`` assigns each
+        row the next ID.
+        """
+        now = datetime.now().isoformat(timespec="seconds")
+        logger.debug("Adding new plist files to database.")
+        rows = (
+            (
+                plist_filename,
+                script_name,
+                now,
+                schedule_type,
+                schedule_value,
+                "inactive",
+                description,
+                plist_file_contents,
             )
+            for (
+                plist_filename,
+                script_name,
+                schedule_type,
+                schedule_value,
+                description,
+                plist_file_contents,
+            ) in plist_files
+        )
+        with PListDbConnectionManager(self.user_config) as cursor:
+            cursor.executemany(PLISTFILES_INSERT_RECORD_INTO, rows)
+            inserted = cursor.rowcount
+            if inserted <= 0:
+                return []
+            (last_id,) = cursor.execute(SELECT_LAST_INSERT_ROWID).fetchone()
+        return list(range(last_id - inserted + 1, last_id + 1))
+
+    def add_running_installation_status(self, file_id):
+        self.set_many_current_states((file_id,), "running")
 
     def add_inactive_installation_status(self, file_id):
+        self.set_many_current_states((file_id,), "inactive")
+        logger.debug("Plist %s now has 'inactive' status.", file_id)
+
+    def set_many_current_states(self, file_ids: Iterable[int], state: str) -> None:
+        """Set the ``CurrentState`` of several plist files in a single transaction.
+
+        Parameters
+        ----------
+        file_ids: Iterable[int]
+            The IDs of the plist files to update.
+        state: str
+            The new state, one of "running", "inactive" or "deleted".
+
+        Notes
+        -----
+        Every state change, single or many, goes through this one parameterised
+        statement, and so one cached compiled statement on the shared connection.
+        """
         with PListDbConnectionManager(self.user_config) as cursor:
-            cursor.execute(
-                PLISTFILES_SET_CURRENT_STATE_INACTIVE,
-                (file_id,),
+            cursor.executemany(
+                PLISTFILES_SET_CURRENT_STATE,
+                ((state, file_id) for file_id in file_ids),
             )
-        logger.debug(f"Plist {file_id} now has 'inactive' status.")
 
 
 class PlistInstallationManager:
@@ -518,7 +772,7 @@ class PlistInstallationManager:
         symlink_to_plist.unlink()
         logger.debug("Updating database.")
         self.plist_db_setters.add_inactive_installation_status(plist_id)
-        logger.info(f"Plist file {plist_id} successfully uninstalled.")
+        logger.info("Plist file %s successfully uninstalled.", plist_id)
 
     def _create_symlink_in_launch_agents_dir(self, plist_file_path: Path):
         launch_agents_dir = self.user_config.launch_agents_dir
@@ -541,17 +795,20 @@ class PlistInstallationManager:
                 capture_output=True,
                 text=True,
             )
-            logger.debug(f"Ran {tool} {command}")
-            logger.debug(f"stdout: {result.stdout}")
-            logger.debug(f"stderr: {result.stderr}")
+            logger.debug("Ran %s %s", tool, command)
+            logger.debug("stdout: %s", result.stdout)
+            logger.debug("stderr: %s", result.stderr)
 
         except subprocess.CalledProcessError as e:
             logger.error(
-                f"Failed to run {tool} {command} for plist file: {symlink_to_plist}"
+                "Failed to run %s %s for plist file: %s",
+                tool,
+                command,
+                symlink_to_plist,
             )
-            logger.error(f"Error message: {str(e)}")
-            logger.error(f"stdout: {e.stdout}")
-            logger.error(f"stderr: {e.stderr}")
+            logger.error("Error message: %s", e)
+            logger.error("stdout: %s", e.stdout)
+            logger.error("stderr: %s", e.stderr)
             raise e
 
 
@@ -581,15 +838,14 @@ class PlistDbGetters:
         PlistFileIDNotFound
             If the given plist id is not found in the database.
         """
-        logger.debug(f'Checking if plist_id "{plist_id}" is in the database')
+        logger.debug('Checking if plist_id "%s" is in the database', plist_id)
         with PListDbConnectionManager(self._user_config) as cursor:
-            cursor.execute(PLISTFILES_SELECT_SINGLE_PLIST_FILE, (plist_id,))
-            target_row = cursor.fetchall()
-            if not target_row:
+            cursor.execute(PLISTFILES_PLIST_ID_EXISTS, (plist_id,))
+            if cursor.fetchone() is None:
                 message = f"There is no plist file with the ID: {plist_id}"
                 logger.error(message)
                 raise PlistFileIDNotFound(message)
-            logger.debug(f'Plist_id "{plist_id}" is in the database')
+            logger.debug('Plist_id "%s" is in the database', plist_id)
 
     def verify_a_plist_id_installation_status(
         self, plist_id: int, expected_status: str
@@ -604,21 +860,33 @@ class PlistDbGetters:
             The expected current installation status in the database.
 
         Raises
+        ------
+        PlistFileIDNotFound
+            If the given plist id is not found in the database.
+        UnexpectedInstallationStatus
+            If the plist file's installation status is not ``expected_status``.
         """
         logger.debug(
-            f'Checking if plist_id "{plist_id}" has an install status of {expected_status}'
+            'Checking if plist_id "%s" has an install status of %s',
+            plist_id,
+            expected_status,
         )
         with PListDbConnectionManager(self._user_config) as cursor:
             cursor.execute(PLISTFILES_GET_INSTALL_STATUS, (plist_id,))
-            install_status = cursor.fetchall()[0][0]
+            row = cursor.fetchone()
+            if row is None:
+                message = f"There is no plist file with the ID: {plist_id}"
+                logger.error(message)
+                raise PlistFileIDNotFound(message)
+            (install_status,) = row
             logger.debug(
-                f'Plist_id "{plist_id}" has an install status if {install_status}'
+                'Plist_id "%s" has an install status of %s', plist_id, install_status
             )
         if install_status != expected_status:
             message = f"Cannot perform operation. Plist ID {plist_id} is already {install_status}"
             logger.debug(message)
             raise UnexpectedInstallationStatus(message)
-        logger.debug(f'Plist id "{plist_id}" has the expected install status.')
+        logger.debug('Plist id "%s" has the expected install status.', plist_id)
 
     def get_all_tracked_plist_files(self) -> list[tuple]:
         """Get details of all tracked plist files.
@@ -636,11 +904,10 @@ class PlistDbGetters:
     def get_a_single_plist_file_details(self, plist_id) -> dict:
         """Get all details and column headings of a given plist file.
 
-        The method calls ``verify_a_plist_is_valid`` to ensure ``plist_id`` is in the
-        database. It fetches the plist file details then the uses the
-        ``cursor.description`` attribute to retrieve the column headings. The column
-        headings and plist file details are combined into a dictionary in the format
-        ``{"field_name": "value"}``.
+        The method fetches the plist file details in a single query, raising if
+        ``plist_id`` is not in the database. The cursor uses ``sqlite3.Row`` so the
+        row converts directly to a dictionary in the format ``{"field_name": "value"}``.
+        Other cursors on the shared connection keep returning plain tuples.
 
         Parameters
         ----------
@@ -652,14 +919,21 @@ class PlistDbGetters:
         plist_detail: dict
             A dictionary containing plist file details in the format
             ``{'PlistFileID': 1, 'PlistFileName': 'mock_plist_1' ...}``.
+
+        Raises
+        ------
+        PlistFileIDNotFound
+            If the given plist id is not found in the database.
         """
-        self.verify_a_plist_id_is_valid(plist_id)
         with PListDbConnectionManager(self._user_config) as cursor:
+            cursor.row_factory = sqlite3.Row
             cursor.execute(PLISTFILES_SELECT_SINGLE_PLIST_FILE, (plist_id,))
-            target_row = cursor.fetchall()
-            description = [description[0] for description in cursor.description]
-        plist_detail = dict(zip(description, target_row[0]))
-        return plist_detail
+            target_row = cursor.fetchone()
+        if target_row is None:
+            message = f"There is no plist file with the ID: {plist_id}"
+            logger.error(message)
+            raise PlistFileIDNotFound(message)
+        return dict(target_row)
 
 
 class DbDisplayer:
@@ -780,11 +1054,24 @@ class DbDisplayer:
         table.add_column("Schedule\nType", justify="center", overflow="fold")
         table.add_column("Schedule\nValue", justify="center", overflow="fold")
         table.add_column("Status", justify="center", overflow="fold")
-        # TODO: Fix this in v0.1.0 tidy up sweep.
-        for row in all_rows:
-            row = list(row)
-            row[3] = self._format_date(row[3])
-            table.add_row(*[str(item) for item in row])
+        for (
+            plist_id,
+            plist_filename,
+            script_name,
+            created_date,
+            schedule_type,
+            schedule_value,
+            current_state,
+        ) in all_rows:
+            table.add_row(
+                str(plist_id),
+                plist_filename,
+                script_name,
+                self._format_date(created_date),
+                schedule_type,
+                str(schedule_value),
+                current_state,
+            )
         return table
 
     def _format_date(self, iso_datetime: str) -> str:
@@ -797,6 +1084,9 @@ class DbDisplayer:
         suffix format was not supported. To support earlier Python versions
         ``_format_date`` replaces Z UTC suffixes with a "+00:00" UTC string.
 
+        Results are cached by ``_format_iso_date`` as plist files created on the same
+        day share a date.
+
         For more see:
         https://docs.python.org/3.11/library/datetime.html#datetime.datetime.fromisoformat
 
@@ -805,22 +1095,8 @@ class DbDisplayer:
         iso_datetime: str
             A valid ISO datetime string.
         """
-        if iso_datetime.endswith("Z"):
-            iso_datetime = iso_datetime.replace("Z", "+00:00")
-        iso_datetime = datetime.fromisoformat(iso_datetime)
-        formatted_date = iso_datetime.strftime("%Y-%m-%d")
-        return formatted_date
+        return _format_iso_date(iso_datetime)
 
     def _style_xml_tags(self, text_to_style: str) -> str:
         """Add ``rich`` styling to any XML opening/closing tags in a string."""
-        re_pattern = r"<([^>]+)>"
-        matches = re.finditer(re_pattern, text_to_style)
-        last_end = 0
-        styled_text = ""
-        for match in matches:
-            start, end = match.span()
-            styled_text += text_to_style[last_end:start]
-            styled_text += f"[grey69]{text_to_style[start:end]}[/grey69]"
-            last_end = end
-        styled_text += text_to_style[last_end:]
-        return styled_text
+        return XML_TAG.sub(r"[grey69]\g<0>[/grey69]", text_to_style)
@@ -24,6 +24,26 @@ CREATE TABLE IF NOT EXISTS PlistFiles (
 );
 """
 
+# Added after the first release. Dbs created before it get these indexes when they
+# are upgraded to `SCHEMA_VERSION` 1; see `PListDbConnectionManager._upgrade_schema`.
+CREATE_INDEXES = """
+CREATE INDEX IF NOT EXISTS idx_plistfiles_currentstate ON PlistFiles (CurrentState);
+CREATE INDEX IF NOT EXISTS idx_installationevents_fileid ON InstallationEvents (FileID);
+"""
+
+# Stored in the db's `PRAGMA user_version`. Bump it when `CREATE_SCHEMA` gains
+# something older dbs should get, e.g. a new index.
+SCHEMA_VERSION = 1
+
+CREATE_SCHEMA = (
+    "BEGIN;"
+    + CREATE_TABLE_PLISTFILES
+    + CREATE_TABLE_INSTALLATION_EVENTS
+    + CREATE_INDEXES
+    + f"PRAGMA user_version = {SCHEMA_VERSION};"
+    + "COMMIT;"
+)
+
 PLISTFILES_INSERT_RECORD_INTO = """
 INSERT INTO PlistFiles (
     PlistFileName,
@@ -40,17 +60,19 @@ VALUES (?, ?, ?, ?, ?, ?, ?, ?);
 
 
 PLISTFILES_COUNT_ALL_ROWS = "SELECT COUNT(*) FROM PlistFiles"
-PLISTFILES_SET_CURRENT_STATE_RUNNING = (
-    "UPDATE PlistFiles SET CurrentState = 'running' WHERE PlistFileID = ?"
+SELECT_LAST_INSERT_ROWID = "SELECT last_insert_rowid()"
+PLISTFILES_SELECT_MAX_PLIST_FILE_ID = (
+    "SELECT COALESCE(MAX(PlistFileID), 0) FROM PlistFiles"
 )
-PLISTFILES_SET_CURRENT_STATE_INACTIVE = (
-    "UPDATE PlistFiles SET CurrentState = 'inactive' WHERE PlistFileID = ?"
+PLISTFILES_SET_CURRENT_STATE = (
+    "UPDATE PlistFiles SET CurrentState = ? WHERE PlistFileID = ?"
 )
 PLISTFILES_GET_INSTALL_STATUS = (
     "SELECT CurrentState FROM  PlistFiles WHERE plistFileId = ?"
 )
 PLISTFILES_SELECT_ALL = "SELECT * FROM PlistFiles"
 PLISTFILES_SELECT_SINGLE_PLIST_FILE = "SELECT * FROM  PlistFiles WHERE plistFileId = ?"
+PLISTFILES_PLIST_ID_EXISTS = "SELECT 1 FROM PlistFiles WHERE PlistFileID = ? LIMIT 1"
 PLISTFILES_SELECT_ALL_FIELDS_FOR_LIST_COMMAND = (
     "SELECT PlistFileID, PlistFileName, ScriptName, CreatedDate, "
     "ScheduleType, ScheduleValue, CurrentState FROM PlistFiles"
@@ -5,6 +5,7 @@ from pathlib import Path
 import pytest
 from launchd_me.plist import (
     LaunchdMeInit,
+    PListDbConnectionManager,
     UserConfig,
 )
 from launchd_me.sql_statements import PLISTFILES_INSERT_RECORD_INTO
@@ -31,6 +32,17 @@ class ConfiguredEnvironmentObjects:
     ldm_init: LaunchdMeInit
 
 
+@pytest.fixture(autouse=True)
+def close_shared_db_connections():
+    """Close the shared database connections opened during each test.
+
+    Every test uses its own `tmp_path` database, so connections would otherwise
+    accumulate for the rest of the session.
+    """
+    yield
+    PListDbConnectionManager.close_all()
+
+
 @pytest.fixture
 def mock_environment(tmp_path) -> ConfiguredEnvironmentObjects:
     """Provide a configured mock environment for testing.
@@ -1,20 +1,40 @@
 import argparse
+import subprocess
+import sys
 from pathlib import Path
 from typing import Any
 from unittest.mock import Mock, patch
 
 import pytest
+from launchd_me import __version__
 from launchd_me.cli import (
+    COMMAND_HANDLERS,
+    SCHEDULE_TYPES,
     CLIArgumentParser,
     create_plist,
     install_plist,
     list_plists,
     main,
+    parse_simple_command,
     reset_user,
     uninstall_plist,
     valid_path,
 )
-from launchd_me.plist import PlistFileIDNotFound
+from launchd_me.plist import PlistFileIDNotFound, ScheduleType
+
+
+@pytest.mark.parametrize("module", ["launchd_me.plist", "launchd_me.logger_config"])
+def test_importing_cli_does_not_import_the_module(module: str):
+    """Test importing `launchd_me.cli` defers importing the given module.
+
+    Runs in a fresh interpreter as the test session has already imported the module.
+    """
+    code = (
+        "import sys, launchd_me.cli; "
+        f"assert {module!r} not in sys.modules, '{module} imported'"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True)
+    assert result.returncode == 0, result.stderr
 
 
 def test_valid_path_for_a_valid_string(tmp_path: Path):
@@ -56,6 +76,37 @@ def test_valid_path_for_invalid_strings():
         valid_path(non_existent_script)
 
 
+def test_valid_path_for_a_directory(tmp_path: Path):
+    """Test `valid_path` function rejects a path to a directory."""
+    with pytest.raises(argparse.ArgumentTypeError):
+        valid_path(str(tmp_path))
+
+
+def test_valid_path_returns_an_absolute_path_for_a_relative_string(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    """Test `valid_path` makes a relative path absolute.
+
+    The plist file uses the script's parent as its working directory so the path must
+    be absolute.
+    """
+    (tmp_path / "synthetic_script.py").touch()
+    monkeypatch.chdir(tmp_path)
+    actual = valid_path("synthetic_script.py")
+    assert actual.is_absolute()
+    assert actual.parent.samefile(tmp_path)
+
+
+def test_valid_path_expands_the_user_directory(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    """Test `valid_path` expands a leading `~` (e.g. from a quoted argument)."""
+    (tmp_path / "synthetic_script.py").touch()
+    monkeypatch.setenv("HOME", str(tmp_path))
+    actual = valid_path("~/synthetic_script.py")
+    assert actual == tmp_path / "synthetic_script.py"
+
+
 class TestCLIArgumentParser:
     """Test suite for the `CLIArgumentParser` class.
 
@@ -97,7 +148,7 @@ class TestCLIArgumentParser:
             subcommands.
         """
         parser_creator = CLIArgumentParser()
-        self.parser = parser_creator.create_parser()
+        self.parser = parser_creator.create_parser([])
 
     @pytest.mark.parametrize(
         "attribute, expected_value",
@@ -107,7 +158,7 @@ class TestCLIArgumentParser:
             ("description", "Test description"),
             ("make_executable", True),
             ("auto_install", True),
-            ("func", create_plist),
+            ("command", "create"),
         ],
     )
     def test_create_command_args(
@@ -161,6 +212,21 @@ class TestCLIArgumentParser:
         args = self.parser.parse_args()
         assert args.script_path.name == "synthetic_script.py"
 
+    @pytest.mark.parametrize(
+        "flags, expected",
+        [
+            (["-m", "-a"], (True, True)),
+            (["--no-make-executable"], (False, True)),
+            (["--no-auto-install"], (True, False)),
+            (["--no-make-executable", "--no-auto-install"], (False, False)),
+        ],
+    )
+    def test_create_command_boolean_flags(self, flags: list, expected: tuple):
+        """Test the `'create'` boolean flags can be switched off."""
+        test_args = ["create", self.synthetic_script, "interval", "300", "Test"]
+        args = self.parser.parse_args(test_args + flags)
+        assert (args.make_executable, args.auto_install) == expected
+
     @pytest.mark.parametrize(
         "test_args, plist_id_value",
         [(["ldm", "list"], None), (["ldm", "list", "123"], 123)],
@@ -186,7 +252,7 @@ class TestCLIArgumentParser:
         """
         monkeypatch.setattr("sys.argv", test_args)
         args = self.parser.parse_args()
-        assert args.func == list_plists
+        assert args.command == "list"
         assert args.plist_id == plist_id_value
 
     def test_install_command_args(self, monkeypatch: pytest.MonkeyPatch):
@@ -203,7 +269,7 @@ class TestCLIArgumentParser:
         test_args = ["ldm", "install", "123"]
         monkeypatch.setattr("sys.argv", test_args)
         args = self.parser.parse_args()
-        assert args.func == install_plist
+        assert args.command == "install"
         assert args.plist_id == "123"
 
     def test_uninstall_command_args(self, monkeypatch: pytest.MonkeyPatch):
@@ -220,7 +286,7 @@ class TestCLIArgumentParser:
         test_args = ["ldm", "uninstall", "123"]
         monkeypatch.setattr("sys.argv", test_args)
         args = self.parser.parse_args()
-        assert args.func == uninstall_plist
+        assert args.command == "uninstall"
         assert args.plist_id == "123"
 
     def test_reset_command_args(self, monkeypatch: pytest.MonkeyPatch):
@@ -237,11 +303,97 @@ class TestCLIArgumentParser:
         test_args = ["ldm", "reset"]
         monkeypatch.setattr("sys.argv", test_args)
         args = self.parser.parse_args()
-        assert args.func == reset_user
+        assert args.command == "reset"
 
+    @pytest.mark.parametrize("argv", [[], ["--help"], ["unknown"]])
+    def test_create_parser_adds_all_subcommands(self, argv: list):
+        """Test all subcommands are added when no single subcommand is requested."""
+        parser_creator = CLIArgumentParser()
+        parser_creator.create_parser(argv)
+        expected = {"create", "list", "install", "uninstall", "reset"}
+        assert set(parser_creator.subparsers.choices) == expected
+        assert (
+            "Easily schedule your scripts on macOS"
+            in parser_creator.parser.format_help()
+        )
 
-@patch("launchd_me.cli.PlistCreator")
-def test_create_plist(MockPlistCreator: Mock):
+    @pytest.mark.parametrize(
+        "argv", [["create", "--help"], ["list"], ["install", "1"], ["reset"]]
+    )
+    def test_create_parser_only_adds_the_requested_subcommand(self, argv: list):
+        """Test only the subcommand named by the first argument is added."""
+        parser_creator = CLIArgumentParser()
+        parser_creator.create_parser(argv)
+        assert list(parser_creator.subparsers.choices) == [argv[0]]
+        assert parser_creator.parser.description is None
+
+
+def test_schedule_types_match_the_schedule_type_enum():
+    """Test the `'create'` schedule type choices match `ScheduleType`."""
+    assert SCHEDULE_TYPES == tuple(
+        schedule_type.value for schedule_type in ScheduleType
+    )
+
+
+def test_command_handlers_cover_every_subcommand():
+    """Test every subcommand added by the parser has a handler."""
+    parser_creator = CLIArgumentParser()
+    parser_creator.create_parser([])
+    assert COMMAND_HANDLERS == {
+        "create": create_plist,
+        "list": list_plists,
+        "install": install_plist,
+        "uninstall": uninstall_plist,
+        "reset": reset_user,
+    }
+    assert set(parser_creator.subparsers.choices) == set(COMMAND_HANDLERS)
+
+
+class TestParseSimpleCommand:
+    """Test suite for the `parse_simple_command` argparse fast path."""
+
+    @pytest.mark.parametrize(
+        "argv",
+        [
+            ["list"],
+            ["list", "3"],
+            ["install", "3"],
+            ["uninstall", "3"],
+            ["reset"],
+        ],
+    )
+    def test_parse_simple_command_matches_the_argument_parser(self, argv: list):
+        """Test the fast path produces the same Namespace as the full parser."""
+        parser = CLIArgumentParser().create_parser()
+        expected = parser.parse_args(argv)
+        actual = parse_simple_command(argv)
+        assert actual == expected
+
+    @pytest.mark.parametrize(
+        "argv",
+        [
+            [],
+            ["--help"],
+            ["list", "--help"],
+            ["list", "abc"],
+            ["list", "²"],
+            ["list", "1", "2"],
+            ["install"],
+            ["install", "-h"],
+            ["uninstall", "1", "2"],
+            ["reset", "now"],
+            ["create", "script.py", "interval", "300", "description"],
+            ["unknown"],
+        ],
+    )
+    def test_parse_simple_command_defers_to_the_argument_parser(self, argv: list):
+        """Test anything other than a well-formed simple command returns None."""
+        assert parse_simple_command(argv) is None
+
+
+@patch("launchd_me.cli._user_config")
+@patch("launchd_me.plist.PlistCreator")
+def test_create_plist(MockPlistCreator: Mock, MockUserConfig: Mock):
     """Test the `create_plist` function within the CLI.
 
     Test `create_plist` calls the expected methods with the expected values, based
@@ -277,8 +429,8 @@ class TestListPlists:
         Test the behaviour of `list_plists` when a specific plist ID is provided.
     """
 
-    @patch("launchd_me.cli.DbDisplayer")
-    @patch("launchd_me.cli.PlistDbGetters")
+    @patch("launchd_me.plist.DbDisplayer")
+    @patch("launchd_me.plist.PlistDbGetters")
     def test_list_plists_without_id_arg(
         self, MockDbGetters: Mock, MockDbDisplayer: Mock
     ):
@@ -311,8 +463,8 @@ class TestListPlists:
             [{"id": "123", "name": "TestPlist"}]
         )
 
-    @patch("launchd_me.cli.DbDisplayer")
-    @patch("launchd_me.cli.PlistDbGetters")
+    @patch("launchd_me.plist.DbDisplayer")
+    @patch("launchd_me.plist.PlistDbGetters")
     def test_list_plists_with_id_arg(self, MockDbGetters: Mock, MockDbDisplayer: Mock):
         """Test `list_plists` for its behaviour when a specific plist ID is provided.
 
@@ -343,10 +495,10 @@ class TestListPlists:
         )
 
 
-@patch("launchd_me.cli.USER_CONFIG", autospec=True)
-@patch("launchd_me.cli.PlistDbGetters")
-@patch("launchd_me.cli.PlistDbSetters")
-@patch("launchd_me.cli.PlistInstallationManager")
+@patch("launchd_me.cli._user_config")
+@patch("launchd_me.plist.PlistDbGetters")
+@patch("launchd_me.plist.PlistDbSetters")
+@patch("launchd_me.plist.PlistInstallationManager")
 def test_install_plist(
     MockInstallationManager: Mock,
     MockDbSetters: Mock,
@@ -366,27 +518,26 @@ def test_install_plist(
     mock_installation_manager = MockInstallationManager.return_value
     mock_user_config = MockUserConfig.return_value
 
-    mock_db_getter.verify_a_plist_id_is_valid.return_value = None
     mock_db_getter.get_a_single_plist_file_details.return_value = {
         "plist_id": "123",
         "PlistFileName": "synthetic_file_name",
     }
     mock_installation_manager.install_plist.return_value
-    mock_user_config.plist_dir = "a_directory"
+    mock_user_config.plist_dir = Path("a_directory")
 
     install_plist(args)
 
-    mock_db_getter.verify_a_plist_id_is_valid.assert_called_once_with("123")
+    mock_db_getter.verify_a_plist_id_is_valid.assert_not_called()
     mock_db_getter.get_a_single_plist_file_details.assert_called_once_with("123")
     mock_installation_manager.install_plist.assert_called_once_with(
-        "123", Path("synthetic_file_name")
+        "123", Path("a_directory") / "synthetic_file_name"
     )
 
 
-@patch("launchd_me.cli.USER_CONFIG", autospec=True)
-@patch("launchd_me.cli.PlistDbGetters")
-@patch("launchd_me.cli.PlistDbSetters")
-@patch("launchd_me.cli.PlistInstallationManager")
+@patch("launchd_me.cli._user_config")
+@patch("launchd_me.plist.PlistDbGetters")
+@patch("launchd_me.plist.PlistDbSetters")
+@patch("launchd_me.plist.PlistInstallationManager")
 def test_uninstall_plist(
     MockInstallationManager, MockDbSetters, MockDbGetters, MockUserConfig
 ):
@@ -400,68 +551,131 @@ def test_uninstall_plist(
     mock_installation_manager = MockInstallationManager.return_value
     mock_user_config = MockUserConfig.return_value
 
-    mock_db_getter.verify_a_plist_id_is_valid.return_value = None
     mock_db_getter.get_a_single_plist_file_details.return_value = {
         "plist_id": "123",
         "PlistFileName": "synthetic_file_name",
     }
     mock_installation_manager.uninstall_plist.return_value
-    mock_user_config.launch_agents_dir = "a_directory"
+    mock_user_config.launch_agents_dir = Path("a_directory")
 
     uninstall_plist(args)
 
-    mock_db_getter.verify_a_plist_id_is_valid.assert_called_once_with("123")
+    mock_db_getter.verify_a_plist_id_is_valid.assert_not_called()
     mock_db_getter.get_a_single_plist_file_details.assert_called_once_with("123")
     mock_installation_manager.uninstall_plist.assert_called_once_with(
-        "123", Path("synthetic_file_name")
+        "123", Path("a_directory") / "synthetic_file_name"
     )
 
 
-# TODO: Wait until the functionality is finished.
-def test_reset_user():
-    args = argparse.Namespace()
-    pass
+@patch("launchd_me.cli._user_config")
+def test_reset_user_deletes_the_project_directory(mock_user_config, tmp_path):
+    project_dir = tmp_path / "launchd-me"
+    (project_dir / "plist_files").mkdir(parents=True)
+    mock_user_config.return_value.project_dir = project_dir
+    reset_user(argparse.Namespace(command="reset"))
+    assert not project_dir.exists()
 
 
+@patch("launchd_me.cli._user_config")
+def test_reset_user_with_a_missing_project_directory(
+    mock_user_config, tmp_path, capsys
+):
+    project_dir = tmp_path / "launchd-me"
+    mock_user_config.return_value.project_dir = project_dir
+    reset_user(argparse.Namespace(command="reset"))
+    assert "Nothing to reset" in capsys.readouterr().out
+    assert not project_dir.exists()
+
+
+@patch("sys.argv", ["ldm"])
 @patch("launchd_me.cli.CLIArgumentParser")
-@patch("launchd_me.cli.LaunchdMeInit")
+@patch("launchd_me.plist.LaunchdMeInit")
 def test_entry_point_main_passes_for_valid_args(
     MockLaunchdMeInit: Mock, MockCLIArgumentParser: Mock
 ):
     """Test the `main` entry point for launchd_me.
 
-    Tests `main` initializes the required components and executes the function
-    specified in the command-line arguments (via the subparsers `func` properties).
+    Tests `main` initializes the required components and executes the handler for
+    the parsed command (via `COMMAND_HANDLERS`).
 
     `mock_parser` represents the Argparse.ArgumentParser created by
     `CLIArgumentParser.create_parser()`. Mock function represents a CLI command
-    function (e.g. `create_plist`).
+    function (e.g. `list_plists`).
     """
     mock_launchd_me_init = MockLaunchdMeInit.return_value
     mock_cli_argument_parser = MockCLIArgumentParser.return_value
     mock_parser = Mock()
     mock_function = Mock()
 
-    mock_parser.parse_args.return_value = argparse.Namespace(func=mock_function)
+    mock_parser.parse_args.return_value = argparse.Namespace(command="list")
     mock_launchd_me_init.initialise_launchd_me.return_value = None
     mock_cli_argument_parser.create_parser.return_value = mock_parser
 
-    main()
+    with patch.dict("launchd_me.cli.COMMAND_HANDLERS", {"list": mock_function}):
+        main()
 
     mock_launchd_me_init.initialise_launchd_me.assert_called_once_with()
     mock_cli_argument_parser.create_parser.assert_called_once_with()
     mock_function.assert_called_once()
 
 
+@patch("sys.argv", ["ldm"])
+@patch("launchd_me.cli.CLIArgumentParser")
+@patch("launchd_me.plist.LaunchdMeInit")
+def test_entry_point_main_skips_initialisation_for_reset(
+    MockLaunchdMeInit: Mock, MockCLIArgumentParser: Mock
+):
+    """Test `main` doesn't initialise launchd_me for `'reset'`.
+
+    `'reset'` deletes the application directory so shouldn't create directories or a
+    database first.
+    """
+    mock_cli_argument_parser = MockCLIArgumentParser.return_value
+    mock_parser = Mock()
+    mock_function = Mock()
+
+    mock_parser.parse_args.return_value = argparse.Namespace(command="reset")
+    mock_cli_argument_parser.create_parser.return_value = mock_parser
+
+    with patch.dict("launchd_me.cli.COMMAND_HANDLERS", {"reset": mock_function}):
+        main()
+
+    MockLaunchdMeInit.assert_not_called()
+    mock_function.assert_called_once()
+
+
+@patch("sys.argv", ["ldm"])
+@patch("launchd_me.cli.CLIArgumentParser")
+@patch("launchd_me.plist.LaunchdMeInit")
+def test_entry_point_main_prints_help_without_a_command(
+    MockLaunchdMeInit: Mock, MockCLIArgumentParser: Mock
+):
+    """Test `main` runs the parser's default action when no command is given.
+
+    Printing help shouldn't create directories or a database.
+    """
+    mock_cli_argument_parser = MockCLIArgumentParser.return_value
+    mock_parser = Mock()
+    args = argparse.Namespace(command=None)
+    mock_parser.parse_args.return_value = args
+    mock_cli_argument_parser.create_parser.return_value = mock_parser
+
+    main()
+
+    MockLaunchdMeInit.assert_not_called()
+    mock_cli_argument_parser._default_action.assert_called_once_with(args)
+
+
+@patch("sys.argv", ["ldm"])
 @patch("launchd_me.cli.CLIArgumentParser")
-@patch("launchd_me.cli.LaunchdMeInit")
+@patch("launchd_me.plist.LaunchdMeInit")
 def test_entry_point_main_handles_exceptions(
     MockLaunchdMeInit: Mock, MockCLIArgumentParser: Mock
 ):
     """Test the `main` entry point for launchd_me handles propagated Exceptions.
 
-    Mocks the required components and executes the function specified in the
-    command-line arguments (via the subparsers `func` properties).
+    Mocks the required components and executes the handler for the parsed command
+    (via `COMMAND_HANDLERS`).
 
     The function `mock_function` replicates producing a `PlistFileIDNotFound` error.
     The test checks `main` handles this exception by printing the appropriate error
@@ -497,14 +711,15 @@ def test_entry_point_main_handles_exceptions(
 
     # Configure returns values for the mocked parser's parse_args method and other
     # initialization steps.
-    mock_parser.parse_args.return_value = argparse.Namespace(func=mock_function)
+    mock_parser.parse_args.return_value = argparse.Namespace(command="list")
     mock_launchd_me_init.initialise_launchd_me.return_value = None
     mock_cli_argument_parser.create_parser.return_value = mock_parser
 
     # Patch the built-in print function to monitor its usage and capture the arguments
     # it receives.
-    with patch("builtins.print") as mock_print:
-        main()
+    with patch.dict("launchd_me.cli.COMMAND_HANDLERS", {"list": mock_function}):
+        with patch("builtins.print") as mock_print:
+            main()
 
     # First assertion.
     mock_print.assert_called_once()
@@ -517,3 +732,39 @@ def test_entry_point_main_handles_exceptions(
     # For comparison, convert the actual printed argument to a string.
     actual = str(args[0])
     assert actual == expected
+
+
+@patch("sys.argv", ["ldm", "reset"])
+@patch("launchd_me.cli.CLIArgumentParser")
+def test_entry_point_main_does_not_build_the_parser_for_simple_commands(
+    MockCLIArgumentParser: Mock,
+):
+    """Test `main` dispatches a simple command without creating the argument parser."""
+    mock_reset_user = Mock()
+    with patch.dict("launchd_me.cli.COMMAND_HANDLERS", {"reset": mock_reset_user}):
+        main()
+    MockCLIArgumentParser.assert_not_called()
+    mock_reset_user.assert_called_once()
+
+
+@pytest.mark.parametrize("version_flag", ["-V", "--version"])
+@patch("launchd_me.cli.CLIArgumentParser")
+def test_entry_point_main_prints_the_version_without_building_the_parser(
+    MockCLIArgumentParser: Mock,
+    version_flag: str,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture,
+):
+    """Test `main` answers `--version` before creating the argument parser."""
+    monkeypatch.setattr("sys.argv", ["ldm", version_flag])
+    main()
+    MockCLIArgumentParser.assert_not_called()
+    assert capsys.readouterr().out == f"ldm {__version__}\n"
+
+
+def test_parser_version_matches_the_fast_path(capsys: pytest.CaptureFixture):
+    """Test the parser's `--version` output matches the `main` fast path."""
+    parser = CLIArgumentParser().create_parser([])
+    with pytest.raises(SystemExit):
+        parser.parse_args(["--version"])
+    assert capsys.readouterr().out == f"ldm {__version__}\n"
@@ -0,0 +1,30 @@
+import subprocess
+import sys
+from pathlib import Path
+
+from launchd_me import logger_config
+
+
+def test_importing_logger_config_does_not_configure_the_logger(tmp_path: Path):
+    """Test importing `launchd_me.logger_config` doesn't create log files or handlers.
+
+    Runs in a fresh interpreter, with a temporary home directory, as the test session
+    has already configured the logger.
+    """
+    code = (
+        "import logging, launchd_me.logger_config; "
+        "assert not logging.getLogger('launchd-me').handlers, 'handlers added'"
+    )
+    env = {"HOME": str(tmp_path), "APPDATA": str(tmp_path)}
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, env=env)
+    assert result.returncode == 0, result.stderr
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_logger_is_configured_once():
+    """Test repeated access returns the same logger without adding handlers."""
+    logger = logger_config.logger
+    handler_count = len(logger.handlers)
+    assert logger_config.logger is logger
+    assert len(logger.handlers) == handler_count
+    assert logger_config.log_path == logger_config.get_log_path()
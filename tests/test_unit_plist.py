@@ -21,7 +21,7 @@ from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 import rich.box
-from launchd_me.exceptions import UnexpectedInstallationStatus
+from launchd_me.exceptions import InvalidScheduleType, UnexpectedInstallationStatus
 from launchd_me.plist import (
     DbDisplayer,
     LaunchdMeInit,
@@ -33,10 +33,17 @@ from launchd_me.plist import (
     PlistInstallationManager,
     ScheduleType,
     UserConfig,
+    _get_user_name,
+    _load_plist_template,
 )
 from launchd_me.sql_statements import (
+    CREATE_TABLE_INSTALLATION_EVENTS,
+    CREATE_TABLE_PLISTFILES,
+    PLISTFILES_COUNT_ALL_ROWS,
     PLISTFILES_SELECT_ALL,
+    PLISTFILES_SELECT_ALL_FIELDS_FOR_LIST_COMMAND,
     PLISTFILES_SELECT_SINGLE_PLIST_FILE,
+    SCHEMA_VERSION,
 )
 from rich.table import Column, Row
 
@@ -83,6 +90,17 @@ class TestUserConfig:
         actual_attributes = set(user_config.__dict__.keys())
         assert expected_attributes == actual_attributes
 
+    def test_user_name_is_looked_up_once(self, tmp_path):
+        _get_user_name.cache_clear()
+        with patch(
+            "launchd_me.plist.getpass.getuser", return_value="a_user"
+        ) as getuser:
+            first = UserConfig(tmp_path)
+            second = UserConfig(tmp_path)
+        _get_user_name.cache_clear()
+        assert first.user_name == second.user_name == "a_user"
+        getuser.assert_called_once()
+
 
 class TestPlistDBConnectionManager:
     EXPECTED_COLUMNS_PLIST_FILES = [
@@ -118,6 +136,13 @@ class TestPlistDBConnectionManager:
         self.mock_app_dir = self.mock_user_dir / "launchd-me"
         self.mock_app_dir.mkdir(parents=True, exist_ok=True)
 
+    def test_init_raises_if_the_application_directory_is_missing(self, tmp_path):
+        """Test connection manager init raises if launchd-me init hasn't run."""
+        user_config = UserConfig(tmp_path / "no_such_user")
+        with pytest.raises(FileNotFoundError):
+            PListDbConnectionManager(user_config)
+        assert not user_config.ldm_db_file.exists()
+
     def test_init_creates_db_file(self):
         """Test connection manager init creates the db if it doesn't exit."""
         self.pdlcm = PListDbConnectionManager(self.user_config)
@@ -180,6 +205,57 @@ class TestPlistDBConnectionManager:
             == self.EXPECTED_COLUMNS_INSTALLATION_EVENTS
         )
 
+    def test_create_db_records_schema_version(self):
+        PListDbConnectionManager(self.user_config)
+        with sqlite3.connect(self.user_config.ldm_db_file) as conn:
+            (user_version,) = conn.execute("PRAGMA user_version").fetchone()
+        conn.close()
+        assert user_version == SCHEMA_VERSION
+
+    def test_opening_an_unversioned_db_upgrades_its_schema(self):
+        """Test a db created before schema versioning gets the version stamped."""
+        with sqlite3.connect(self.user_config.ldm_db_file) as conn:
+            conn.executescript(CREATE_TABLE_PLISTFILES)
+        conn.close()
+        with PListDbConnectionManager(self.user_config) as cursor:
+            (user_version,) = cursor.execute("PRAGMA user_version").fetchone()
+        assert user_version == SCHEMA_VERSION
+
+    def test_create_db_creates_indexes(self):
+        PListDbConnectionManager(self.user_config)
+        with sqlite3.connect(self.user_config.ldm_db_file) as conn:
+            indexes = conn.execute(
+                "SELECT tbl_name, name FROM sqlite_master WHERE type='index' "
+                "AND name LIKE 'idx_%'"
+            ).fetchall()
+        conn.close()
+        assert sorted(indexes) == [
+            ("InstallationEvents", "idx_installationevents_fileid"),
+            ("PlistFiles", "idx_plistfiles_currentstate"),
+        ]
+
+    def test_opening_a_db_created_before_the_indexes_adds_them(self):
+        """Test an existing pre-index db, with data, gets the indexes on first use."""
+        with sqlite3.connect(self.user_config.ldm_db_file) as conn:
+            conn.executescript(
+                CREATE_TABLE_PLISTFILES + CREATE_TABLE_INSTALLATION_EVENTS
+            )
+        conn.close()
+        add_three_plist_file_entries_to_a_plist_files_table(
+            self.user_config.ldm_db_file
+        )
+        with PListDbConnectionManager(self.user_config) as cursor:
+            indexes = cursor.execute(
+                "SELECT name FROM sqlite_master WHERE type='index' "
+                "AND name LIKE 'idx_%' ORDER BY name"
+            ).fetchall()
+            (row_count,) = cursor.execute(PLISTFILES_COUNT_ALL_ROWS).fetchone()
+        assert indexes == [
+            ("idx_installationevents_fileid",),
+            ("idx_plistfiles_currentstate",),
+        ]
+        assert row_count == 3
+
     def test_dunder_enter(self):
         """Test the enter method returns a Cursor object with a valid DB connection.
 
@@ -195,8 +271,43 @@ class TestPlistDBConnectionManager:
             cursor = cursor.fetchone()
             assert cursor == expected
         finally:
-            pldbcm.cursor.close()
-            pldbcm.connection.close()
+            pldbcm.__exit__(None, None, None)
+
+    def test_connection_is_shared_between_managers(self):
+        """Test managers for the same db reuse one connection across `with` blocks."""
+        with PListDbConnectionManager(self.user_config) as cursor:
+            first_connection = cursor.connection
+        with PListDbConnectionManager(self.user_config) as cursor:
+            second_connection = cursor.connection
+        assert first_connection is second_connection
+
+    def test_connection_is_replaced_if_the_db_is_deleted(self):
+        """Test a deleted db is recreated with a new connection, not the stale one."""
+        with PListDbConnectionManager(self.user_config) as cursor:
+            first_connection = cursor.connection
+        self.user_config.ldm_db_file.unlink()
+        with PListDbConnectionManager(self.user_config) as cursor:
+            cursor.execute("SELECT * FROM PlistFiles")
+            second_connection = cursor.connection
+        assert first_connection is not second_connection
+        assert self.user_config.ldm_db_file.exists()
+
+    def test_connection_uses_write_ahead_logging(self):
+        """Test shared connections are opened in WAL mode with NORMAL sync."""
+        with PListDbConnectionManager(self.user_config) as cursor:
+            journal_mode = cursor.execute("PRAGMA journal_mode").fetchone()[0]
+            synchronous = cursor.execute("PRAGMA synchronous").fetchone()[0]
+        assert journal_mode == "wal"
+        assert synchronous == 1
+
+    def test_close_all_closes_shared_connections(self):
+        """Test `close_all` closes and forgets every shared connection."""
+        with PListDbConnectionManager(self.user_config) as cursor:
+            connection = cursor.connection
+        PListDbConnectionManager.close_all()
+        assert PListDbConnectionManager._connections == {}
+        with pytest.raises(sqlite3.ProgrammingError):
+            connection.execute("SELECT 1")
 
 
 class TestLaunchdMeInit:
@@ -212,6 +323,16 @@ class TestLaunchdMeInit:
     def test_initialise_launchd_me(self):
         """Calls multiple methods so tested in integration tests."""
 
+    def test_initialise_launchd_me_returns_early_if_already_initialised(
+        self, mock_user_config
+    ):
+        """Test a second initialisation doesn't re-run the initialisation methods."""
+        ldm = LaunchdMeInit(mock_user_config)
+        ldm.initialise_launchd_me()
+        with patch.object(ldm, "_create_app_directories") as mock_create_dirs:
+            ldm.initialise_launchd_me()
+        mock_create_dirs.assert_not_called()
+
     def test_create_app_directories(self, mock_user_config):
         """Checks `_create_app_directores` behaves as expected."""
         ldm = LaunchdMeInit(mock_user_config)
@@ -230,6 +351,17 @@ class TestLaunchdMeInit:
         ldm._ensure_db_exists()
         assert mock_user_config.ldm_db_file.exists()
 
+    def test_ensure_db_exists_creates_schema_without_a_manager(self, mock_user_config):
+        mock_user_config.project_dir.mkdir()
+        ldm = LaunchdMeInit(mock_user_config)
+        with patch.object(PListDbConnectionManager, "__init__") as mock_init:
+            ldm._ensure_db_exists()
+        mock_init.assert_not_called()
+        with sqlite3.connect(mock_user_config.ldm_db_file) as conn:
+            tables = conn.execute("SELECT name FROM sqlite_master").fetchall()
+        conn.close()
+        assert ("PlistFiles",) in tables
+
 
 class TestPlistInstallationManager:
     @pytest.fixture(autouse=True)
@@ -375,6 +507,24 @@ class TestPlistCreator:
         expected = "local.mock_user_name.interval_task_0001.plist"
         assert actual == expected
 
+    def test_generate_file_name_uses_the_next_plist_id(self, plc_interval):
+        """Test the file name uses the ID after the highest existing plist ID."""
+        LaunchdMeInit(plc_interval.user_config).initialise_launchd_me()
+        add_three_plist_file_entries_to_a_plist_files_table(
+            plc_interval.user_config.ldm_db_file
+        )
+        actual = plc_interval._generate_file_name()
+        expected = "local.mock_user_name.interval_task_0004.plist"
+        assert actual == expected
+
+    def test_generate_file_name_keeps_dots_in_the_script_name(self, plc_interval):
+        """Test only the final suffix is stripped from a script name with dots."""
+        LaunchdMeInit(plc_interval.user_config).initialise_launchd_me()
+        plc_interval.path_to_script_to_automate = Path("daily.tidy.py")
+        actual = plc_interval._generate_file_name()
+        expected = "local.mock_user_name.daily.tidy_0001.plist"
+        assert actual == expected
+
     def test_write_file_and_make_script_executable(self, plc_interval, tmp_path):
         """Test writing mock content to a mock file.
 
@@ -389,6 +539,16 @@ class TestPlistCreator:
         assert mock_file.read_text() == mock_content
         assert os.access(mock_file, os.X_OK)
 
+    def test_make_script_executable_keeps_existing_mode_bits(
+        self, plc_interval, tmp_path
+    ):
+        mock_file = tmp_path / "mock_file"
+        mock_file.touch()
+        mock_file.chmod(0o640)
+        plc_interval.path_to_script_to_automate = mock_file
+        plc_interval._make_script_executable()
+        assert mock_file.stat().st_mode & 0o777 == 0o751
+
     @pytest.mark.parametrize(
         "calendar_schedule",
         [
@@ -421,7 +581,7 @@ class TestPlistCreator:
     def test_validate_calendar_schedule_with_invalid_keys(
         self, plc_calendar, calendar_schedule
     ):
-        with pytest.raises(Exception):
+        with pytest.raises(InvalidScheduleType):
             plc_calendar._validate_calendar_schedule(calendar_schedule)
 
     @pytest.mark.parametrize(
@@ -432,12 +592,15 @@ class TestPlistCreator:
             {"Hour": 25},
             {"Minute": -2},
             {"Weekday": 8},
+            {"Weekday": 7},
+            {"Hour": "1"},
+            {"Hour": 1.5},
         ],
     )
     def test_validate_calendar_schedule_with_invalid_values(
         self, plc_calendar, calendar_schedule
     ):
-        with pytest.raises(Exception):
+        with pytest.raises(InvalidScheduleType):
             plc_calendar._validate_calendar_schedule(calendar_schedule)
 
     def test_create_schedule_block(self, plc_interval):
@@ -468,12 +631,25 @@ class TestPlistCreator:
         assert content_lines[5] == line_idx_5
         assert content_lines[9] == line_idx_9
         assert content_lines[18].endswith(line_idx_18_ends)
+        assert "{{" not in content
         if sys.platform == "darwin":
             plist_file = plc_interval.user_config.plist_dir / "test.plist"
             plist_file.parent.mkdir(parents=True)
             plist_file.write_text(content)
             assert subprocess.run(["plutil", "-lint", str(plist_file)])
 
+    def test_create_plist_content_reads_the_template_once(self, plc_interval):
+        """Test repeated plist content creation reuses the cached template."""
+        mock_template_path = MagicMock()
+        mock_template_path.read_text.return_value = "{{NAME_OF_PLIST_FILE}}"
+        plc_interval.user_config.plist_template_path = mock_template_path
+        _load_plist_template.cache_clear()
+        first = plc_interval._create_plist_content("file_1", "block")
+        second = plc_interval._create_plist_content("file_2", "block")
+        _load_plist_template.cache_clear()
+        assert (first, second) == ("file_1", "file_2")
+        mock_template_path.read_text.assert_called_once_with(encoding="utf-8")
+
 
 class TestDBSetters:
     """
@@ -534,6 +710,105 @@ class TestDBSetters:
         assert actual[0][0:3] == expected[0][0:3]
         assert actual[0][4:7] == expected[0][4:7]
 
+    def test_add_many_newly_created_plist_files(
+        self, mock_environment: ConfiguredEnvironmentObjects
+    ):
+        """Test adding several Plist file records to the PlistFiles table at once.
+
+        The value at index 3 is `created_time` which is ignored in the assert
+        statements.
+        """
+        dbs = PlistDbSetters(mock_environment.user_config)
+        plist_ids = dbs.add_many_newly_created_plist_files(
+            [
+                ("plist_1", "script_1", "interval", "300", "first", "content 1"),
+                ("plist_2", "script_2", "calendar", "{Hour: 8}", "second", "content 2"),
+            ]
+        )
+        connection = sqlite3.connect(mock_environment.user_config.ldm_db_file)
+        cursor = connection.cursor()
+        cursor.execute(PLISTFILES_SELECT_ALL)
+        actual = cursor.fetchall()
+        connection.close()
+        expected = [
+            (1, "plist_1", "script_1", "interval", "300", "inactive", "first"),
+            (2, "plist_2", "script_2", "calendar", "{Hour: 8}", "inactive", "second"),
+        ]
+        assert [row[0:3] + row[4:8] for row in actual] == expected
+        assert plist_ids == [1, 2]
+
+    def test_add_many_newly_created_plist_files_returns_ids_after_existing_rows(
+        self, mock_environment: ConfiguredEnvironmentObjects
+    ):
+        """Test the returned IDs follow on from rows already in the table."""
+        add_three_plist_file_entries_to_a_plist_files_table(
+            mock_environment.user_config.ldm_db_file
+        )
+        dbs = PlistDbSetters(mock_environment.user_config)
+        plist_ids = dbs.add_many_newly_created_plist_files(
+            [
+                ("plist_4", "script_4", "interval", 300, "fourth", "content 4"),
+                ("plist_5", "script_5", "interval", 600, "fifth", "content 5"),
+            ]
+        )
+        assert plist_ids == [4, 5]
+
+    def test_add_many_newly_created_plist_files_with_no_rows(
+        self, mock_environment: ConfiguredEnvironmentObjects
+    ):
+        dbs = PlistDbSetters(mock_environment.user_config)
+        assert dbs.add_many_newly_created_plist_files([]) == []
+
+    def test_batch_commits_once_when_the_block_exits(
+        self, mock_environment: ConfiguredEnvironmentObjects
+    ):
+        """Test setter calls inside `batch` only become visible after the block.
+
+        An independent connection can't see uncommitted rows, so the row count is
+        zero until the batch commits.
+        """
+        connection = sqlite3.connect(mock_environment.user_config.ldm_db_file)
+        dbs = PlistDbSetters(mock_environment.user_config)
+        with dbs.batch() as batch:
+            batch.add_newly_created_plist_file("1", "1", "interval", "1", "1", "1")
+            batch.add_newly_created_plist_file("2", "2", "interval", "2", "2", "2")
+            count_during = connection.execute(PLISTFILES_COUNT_ALL_ROWS).fetchone()
+        count_after = connection.execute(PLISTFILES_COUNT_ALL_ROWS).fetchone()
+        connection.close()
+        assert count_during == (0,)
+        assert count_after == (2,)
+
+    def test_batch_holds_the_write_lock(
+        self, mock_environment: ConfiguredEnvironmentObjects
+    ):
+        """Test other connections can't write while a batch is open.
+
+        `PlistCreator.driver` relies on this to read the next plist ID and insert its
+        row without another process claiming the same ID in between.
+        """
+        connection = sqlite3.connect(
+            mock_environment.user_config.ldm_db_file, timeout=0
+        )
+        dbs = PlistDbSetters(mock_environment.user_config)
+        with dbs.batch():
+            with pytest.raises(sqlite3.OperationalError, match="locked"):
+                connection.execute("BEGIN IMMEDIATE")
+        connection.close()
+
+    def test_batch_rolls_back_every_call_on_error(
+        self, mock_environment: ConfiguredEnvironmentObjects
+    ):
+        """Test an exception inside `batch` discards all the writes in the block."""
+        dbs = PlistDbSetters(mock_environment.user_config)
+        with pytest.raises(ValueError):
+            with dbs.batch() as batch:
+                batch.add_newly_created_plist_file("1", "1", "interval", "1", "1", "1")
+                raise ValueError("Synthetic error")
+        connection = sqlite3.connect(mock_environment.user_config.ldm_db_file)
+        count = connection.execute(PLISTFILES_COUNT_ALL_ROWS).fetchone()
+        connection.close()
+        assert count == (0,)
+
     def test_add_running_installation_status(
         self, mock_environment: ConfiguredEnvironmentObjects
     ):
@@ -563,6 +838,24 @@ class TestDBSetters:
         updated_status = cursor.fetchall()
         assert updated_status == [("running",)]
 
+    def test_set_many_current_states(
+        self, mock_environment: ConfiguredEnvironmentObjects
+    ):
+        """Test several plist files' states are set at once, leaving the rest."""
+        add_three_plist_file_entries_to_a_plist_files_table(
+            mock_environment.user_config.ldm_db_file
+        )
+        dbs = PlistDbSetters(mock_environment.user_config)
+        dbs.set_many_current_states([2, 3], "deleted")
+        connection = sqlite3.connect(mock_environment.user_config.ldm_db_file)
+        cursor = connection.cursor()
+        cursor.execute(
+            "SELECT PlistFileID, CurrentState FROM PlistFiles ORDER BY PlistFileID"
+        )
+        actual = cursor.fetchall()
+        connection.close()
+        assert actual == [(1, "running"), (2, "deleted"), (3, "deleted")]
+
     def test_add_inactive_installation_status(
         self, mock_environment: ConfiguredEnvironmentObjects
     ):
@@ -671,6 +964,16 @@ class TestDbGetters:
                 plist_id, expected_installation_status
             )
 
+    def test_verify_a_plist_id_installation_status_raises_for_an_invalid_id(self):
+        """Test the method raises ``PlistFileIDNotFound`` for a PlistFileID of `4`
+        when the database only contains three synthetic rows.
+        """
+        add_three_plist_file_entries_to_a_plist_files_table(
+            self.dbg._user_config.ldm_db_file
+        )
+        with pytest.raises(PlistFileIDNotFound):
+            self.dbg.verify_a_plist_id_installation_status(4, "running")
+
     def test_get_all_tracked_plist_files_for_three_rows_of_data(self):
         """Test `get_all_tracked_plist_files` works correctly with three synthetic rows
         of data.
@@ -781,8 +1084,7 @@ class TestDbGetters:
     def test_get_a_single_plist_file_details_for_an_invalid_plist_file_id(self):
         """Test `get_a_single_plist_file` for a plist id not in the database.
 
-        `get_a_single_plist_file` calls `verify_a_plist_id_is_valid` which will raise
-        an error if the plist is not in the database.
+        `get_a_single_plist_file` raises an error if the plist is not in the database.
         """
         with pytest.raises(PlistFileIDNotFound):
             self.dbg.get_a_single_plist_file_details(1)
@@ -799,6 +1101,7 @@ class TestDbDisplayer:
             ("2024-06-21T08:22:31-04:00", "2024-06-21"),
             ("2024-09-10T17:45:12+01:00", "2024-09-10"),
             ("2024-09-10T17:45:12Z", "2024-09-10"),
+            ("2024-09-10", "2024-09-10"),
         ],
     )
     def test_format_date_with_various_iso_formats(
@@ -1030,8 +1333,9 @@ class TestDbDisplayerAllTrackedPlistFilesTable:
         )
         connection = sqlite3.connect(mock_environment.user_config.ldm_db_file)
         cursor = connection.cursor()
-        cursor.execute(PLISTFILES_SELECT_ALL)
+        cursor.execute(PLISTFILES_SELECT_ALL_FIELDS_FOR_LIST_COMMAND)
         all_rows = cursor.fetchall()
+        connection.close()
         self.db_displayer = DbDisplayer(mock_environment.user_config)
         self.actual_all_tracked_table = (
             self.db_displayer._create_all_tracked_plist_files_table(all_rows)